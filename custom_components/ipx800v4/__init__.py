@@ -1,12 +1,11 @@
 """Support for the GCE IPX800 V4."""
 
 from base64 import b64decode
-from datetime import timedelta
 from http import HTTPStatus
 import logging
+from typing import Any, ClassVar
 
 from aiohttp import web
-from pypx800 import IPX800, Ipx800CannotConnectError, Ipx800InvalidAuthError
 import voluptuous as vol
 
 from homeassistant.helpers.device_registry import DeviceEntry
@@ -29,34 +28,52 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import slugify
 
 from .const import (
+    BULK_BIT_TYPES,
     CONF_COMPONENT,
+    CONF_COUNTER_SCAN_INTERVAL,
     CONF_DEFAULT_BRIGHTNESS,
     CONF_DEVICES,
     CONF_EXT_ID,
     CONF_ID,
     CONF_IDS,
     CONF_INVERT_VALUE,
+    CONF_M2M_PORT,
+    CONF_MAX_CONNECTIONS,
+    CONF_MIN_SCAN_INTERVAL,
     CONF_PUSH_CHECK_HOST,
+    CONF_PUSH_HEARTBEAT,
     CONF_PUSH_PASSWORD,
+    CONF_PUSH_VERIFY_INTERVAL,
+    CONF_REQUEST_TIMEOUT,
+    CONF_SLOW_SCAN_INTERVAL,
     CONF_TRANSITION,
+    CONF_TRANSPORT,
+    CONF_TRAVEL_TIME,
     CONF_TYPE,
     CONF_TYPE_ALLOWED,
     CONTROLLER,
     COORDINATOR,
+    DEFAULT_M2M_PORT,
+    DEFAULT_MAX_REQUESTS,
+    DEFAULT_PUSH_VERIFY_INTERVAL,
+    DEFAULT_REQUEST_TIMEOUT,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_TRANSITION,
+    DEFAULT_TRAVEL_TIME,
     DOMAIN,
+    POLL_STAGGER,
+    PUSH_REGISTRY,
     PUSH_USERNAME,
-    REQUEST_REFRESH_DELAY,
-    TYPE_COUNTER,
+    STORAGE_VERSION,
+    TRANSPORT_HTTP,
+    TRANSPORT_M2M,
+    TYPE_GROUPS,
     TYPE_RELAY,
     TYPE_X4VR,
     TYPE_X4VR_BSO,
@@ -65,6 +82,16 @@ from .const import (
     TYPE_XPWM_RGBW,
     UNDO_UPDATE_LISTENER,
 )
+from .coordinator import (
+    IpxDataUpdateCoordinator,
+    IpxPollStagger,
+    build_group_intervals,
+    build_poll_groups,
+    parse_refresh_groups,
+)
+from .gateway import IpxGateway, create_gateway_session
+from .m2m import IpxM2MConnection
+from .snapshot import PUSH_ON_STATES, Slot, pushed_value, slot_for_key
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -91,6 +118,7 @@ DEVICE_CONFIG_SCHEMA_ENTRY = vol.Schema(
         vol.Optional(CONF_DEFAULT_BRIGHTNESS): cv.positive_int,
         vol.Optional(CONF_ICON): cv.icon,
         vol.Optional(CONF_TRANSITION, default=DEFAULT_TRANSITION): vol.Coerce(float),
+        vol.Optional(CONF_TRAVEL_TIME, default=DEFAULT_TRAVEL_TIME): vol.Coerce(float),
         vol.Optional(CONF_DEVICE_CLASS): cv.string,
         vol.Optional(CONF_UNIT_OF_MEASUREMENT): cv.string,
     }
@@ -105,8 +133,27 @@ GATEWAY_CONFIG = vol.Schema(
         vol.Optional(CONF_USERNAME): cv.string,
         vol.Optional(CONF_PASSWORD): cv.string,
         vol.Optional(CONF_SCAN_INTERVAL): cv.positive_int,
+        vol.Optional(CONF_SLOW_SCAN_INTERVAL): cv.positive_int,
+        vol.Optional(CONF_COUNTER_SCAN_INTERVAL): cv.positive_int,
+        vol.Optional(CONF_MIN_SCAN_INTERVAL): vol.All(
+            cv.positive_int, vol.Range(min=1)
+        ),
+        vol.Optional(CONF_TRANSPORT, default=TRANSPORT_HTTP): vol.In(
+            [TRANSPORT_HTTP, TRANSPORT_M2M]
+        ),
+        vol.Optional(CONF_M2M_PORT, default=DEFAULT_M2M_PORT): cv.port,
+        vol.Optional(CONF_MAX_CONNECTIONS, default=DEFAULT_MAX_REQUESTS): vol.All(
+            cv.positive_int, vol.Range(min=1)
+        ),
+        vol.Optional(CONF_REQUEST_TIMEOUT, default=DEFAULT_REQUEST_TIMEOUT): vol.All(
+            cv.positive_int, vol.Range(min=1)
+        ),
         vol.Optional(CONF_PUSH_PASSWORD): cv.string,
         vol.Optional(CONF_PUSH_CHECK_HOST, default=True): cv.boolean,
+        vol.Optional(CONF_PUSH_HEARTBEAT): cv.positive_int,
+        vol.Optional(
+            CONF_PUSH_VERIFY_INTERVAL, default=DEFAULT_PUSH_VERIFY_INTERVAL
+        ): cv.positive_int,
         vol.Optional(CONF_DEVICES, default=[]): vol.All(
             cv.ensure_list, [DEVICE_CONFIG_SCHEMA_ENTRY]
         ),
@@ -142,70 +189,102 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     config = entry.data
     options = entry.options
 
-    session = async_get_clientsession(hass, False)
-
-    specific_devices_types = []
-    if any(d[CONF_TYPE] == TYPE_COUNTER for d in config[CONF_DEVICES]):
-        specific_devices_types.append(TYPE_COUNTER)
+    # A HTTP session of its own, closed with the entry
+    max_connections = config.get(CONF_MAX_CONNECTIONS, DEFAULT_MAX_REQUESTS)
+    request_timeout = config.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT)
+    session = create_gateway_session(max_connections, request_timeout)
+    entry.async_on_unload(session.close)
+
+    # JSON API requests can use a persistent M2M connection instead of HTTP
+    m2m = None
+    if config.get(CONF_TRANSPORT) == TRANSPORT_M2M:
+        m2m = IpxM2MConnection(
+            config[CONF_HOST],
+            config.get(CONF_M2M_PORT, DEFAULT_M2M_PORT),
+            config[CONF_API_KEY],
+        )
 
-    ipx = IPX800(
+    # All requests to this IPX800, polls and commands, share one scheduler
+    ipx = IpxGateway(
         host=config[CONF_HOST],
         port=config[CONF_PORT],
         api_key=config[CONF_API_KEY],
         username=config.get(CONF_USERNAME),
         password=config.get(CONF_PASSWORD),
-        specific_devices_types=specific_devices_types,
         session=session,
+        request_timeout=request_timeout,
+        max_requests=max_connections,
+        m2m=m2m,
     )
 
-    async def check_connection():
-        if not await ipx.ping():
-            raise Ipx800CannotConnectError
-
-    try:
-        await check_connection()
-    except Ipx800CannotConnectError as exception:
-        _LOGGER.error(
-            "Cannot connect to the IPX800 named %s, check host, port or api_key",
-            config[CONF_NAME],
-        )
-        raise ConfigEntryNotReady from exception
-
-    async def async_update_data():
-        """Fetch data from API."""
-        try:
-            return await ipx.global_get()
-        except Ipx800InvalidAuthError as err:
-            raise UpdateFailed("Authentication error on IPX800") from err
-        except Ipx800CannotConnectError as err:
-            raise UpdateFailed(f"Failed to communicating with API: {err}") from err
-
     scan_interval = options.get(
         CONF_SCAN_INTERVAL, config.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
     )
 
+    # Slow changing values can be polled less often, default to scan_interval.
+    # Options unset from the options flow are None and follow it too.
+    slow_scan_interval = (
+        options.get(CONF_SLOW_SCAN_INTERVAL, config.get(CONF_SLOW_SCAN_INTERVAL))
+        or scan_interval
+    )
+    counter_scan_interval = (
+        options.get(CONF_COUNTER_SCAN_INTERVAL, config.get(CONF_COUNTER_SCAN_INTERVAL))
+        or scan_interval
+    )
+    # Set to adapt the scan interval to the IPX800, down to this value
+    min_scan_interval = options.get(
+        CONF_MIN_SCAN_INTERVAL, config.get(CONF_MIN_SCAN_INTERVAL)
+    )
+
     if scan_interval < 10:
         _LOGGER.warning(
             "A scan interval too low has been set, you probably will get errors since the IPX800 can't handle too much request at the same time"
         )
 
-    coordinator = DataUpdateCoordinator(
+    # Load each supported component entities from their devices
+    devices = build_device_list(config.get(CONF_DEVICES, []))
+
+    # Only poll the groups read by the configured devices, each at its own rate
+    coordinator = IpxDataUpdateCoordinator(
         hass,
-        _LOGGER,
-        name=DOMAIN,
-        update_method=async_update_data,
-        update_interval=timedelta(seconds=scan_interval),
-        request_refresh_debouncer=Debouncer(
-            hass,
-            _LOGGER,
-            cooldown=REQUEST_REFRESH_DELAY,
-            immediate=False,
+        ipx,
+        build_group_intervals(
+            build_poll_groups(devices),
+            scan_interval,
+            slow_scan_interval,
+            counter_scan_interval,
         ),
+        scan_interval,
+        # Groups pushed in bulk are only verified while pushes keep coming
+        push_heartbeat=config.get(CONF_PUSH_HEARTBEAT),
+        push_verify_interval=config.get(
+            CONF_PUSH_VERIFY_INTERVAL, DEFAULT_PUSH_VERIFY_INTERVAL
+        ),
+        store=Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}"),
+        # The gateways poll one after the other, not all at once
+        stagger=hass.data[DOMAIN].setdefault(POLL_STAGGER, IpxPollStagger()),
+        min_scan_interval=min_scan_interval,
     )
 
-    undo_listener = entry.add_update_listener(_async_update_listener)
+    # The first poll also checks the connection: with a saved snapshot,
+    # entities start from it while the poll runs in the background
+    if await coordinator.async_restore():
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+        )
+    else:
+        await coordinator.async_refresh()
+        if not coordinator.last_update_success:
+            _LOGGER.error(
+                "Cannot connect to the IPX800 named %s, check host, port or api_key",
+                config[CONF_NAME],
+            )
+            await ipx.async_close()
+            raise ConfigEntryNotReady from coordinator.last_exception
 
-    await coordinator.async_refresh()
+    hass.data[DOMAIN][POLL_STAGGER].add(coordinator)
+
+    undo_listener = entry.add_update_listener(_async_update_listener)
 
     hass.data[DOMAIN][entry.entry_id] = {
         CONF_NAME: config[CONF_NAME],
@@ -232,52 +311,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
         return True
 
-    # Load each supported component entities from their devices
-    devices = build_device_list(config[CONF_DEVICES])
-
+    # Only the platforms of the configured devices are loaded
+    platform_devices = hass.data[DOMAIN][entry.entry_id][CONF_DEVICES]
     for component in PLATFORMS:
-        _LOGGER.debug("Load component %s", component)
-        hass.data[DOMAIN][entry.entry_id][CONF_DEVICES][component] = filter_device_list(
-            devices, component
-        )
+        if component_devices := filter_device_list(devices, component):
+            _LOGGER.debug("Load component %s", component)
+            platform_devices[component] = component_devices
+    # The adapted scan interval is shown by a diagnostic sensor
+    if min_scan_interval is not None:
+        platform_devices.setdefault(Platform.SENSOR, [])
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(entry, list(platform_devices))
 
     # Provide endpoints for the IPX to call to push states
     if CONF_PUSH_PASSWORD in config:
-        hass.http.register_view(
-            IpxRequestView(
-                config[CONF_NAME],
-                config[CONF_HOST],
-                config[CONF_PUSH_PASSWORD],
-                config[CONF_PUSH_CHECK_HOST],
-            )
-        )
-        hass.http.register_view(
-            IpxRequestDataView(
-                config[CONF_NAME],
-                config[CONF_HOST],
-                config[CONF_PUSH_PASSWORD],
-                config[CONF_PUSH_CHECK_HOST],
-            )
-        )
-        hass.http.register_view(
-            IpxRequestBulkUpdateView(
+        # The views are shared by all the gateways, registered with the first
+        if (push_registry := hass.data[DOMAIN].get(PUSH_REGISTRY)) is None:
+            push_registry = hass.data[DOMAIN][PUSH_REGISTRY] = IpxPushRegistry()
+            for view in (
+                IpxRequestView,
+                IpxRequestDataView,
+                IpxRequestBulkUpdateView,
+                IpxRequestRefreshView,
+            ):
+                hass.http.register_view(view(push_registry))
+        push_registry.add(
+            entry.entry_id,
+            IpxPushGateway(
                 config[CONF_NAME],
                 config[CONF_HOST],
                 config[CONF_PUSH_PASSWORD],
                 config[CONF_PUSH_CHECK_HOST],
                 devices,
-            )
-        )
-        hass.http.register_view(
-            IpxRequestRefreshView(
-                config[CONF_NAME],
-                config[CONF_HOST],
-                config[CONF_PUSH_PASSWORD],
-                config[CONF_PUSH_CHECK_HOST],
                 coordinator,
-            )
+            ),
         )
     else:
         _LOGGER.info(
@@ -290,14 +357,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    for component in PLATFORMS:
-        await hass.config_entries.async_forward_entry_unload(entry, component)
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    if not await hass.config_entries.async_unload_platforms(
+        entry, list(entry_data[CONF_DEVICES])
+    ):
+        return False
+
+    hass.data[DOMAIN][POLL_STAGGER].remove(entry_data[COORDINATOR])
 
-    del hass.data[DOMAIN]
+    # The views stay registered for the other gateways
+    if (push_registry := hass.data[DOMAIN].get(PUSH_REGISTRY)) is not None:
+        push_registry.remove(entry.entry_id)
+
+    await entry_data[CONTROLLER].async_close()
+    hass.data[DOMAIN].pop(entry.entry_id)
 
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the saved snapshot of a config entry."""
+    await Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_remove()
+
+
 async def _async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
     """Handle options update."""
     await hass.config_entries.async_reload(config_entry.entry_id)
@@ -430,6 +512,49 @@ def filter_device_list(devices: list, component: str) -> list:
     return list(filter(lambda d: d[CONF_COMPONENT] == component, devices))
 
 
+def build_bulk_index(
+    devices: list,
+) -> dict[str, list[tuple[int, str, bool, Slot | None]]]:
+    """Build the (index, entity_id, invert_value, slot) entries of each type.
+
+    Entries are sorted by index, the position of the device bit in the
+    data pushed by the IPX800. The slot is the snapshot slot storing the
+    bit, None for the types whose values are not bits.
+    """
+    bulk_index: dict[str, list[tuple[int, str, bool, Slot | None]]] = {}
+    for device_config in devices:
+        if CONF_ID not in device_config:
+            continue
+        index = int(device_config[CONF_ID]) - 1
+        if index < 0:
+            continue
+        entity_id = ".".join(
+            [device_config[CONF_COMPONENT], slugify(device_config[CONF_NAME])]
+        )
+        slot = None
+        if device_config[CONF_TYPE] in BULK_BIT_TYPES:
+            slot = slot_for_key(f"{TYPE_GROUPS[device_config[CONF_TYPE]]}{index + 1}")
+        bulk_index.setdefault(device_config[CONF_TYPE], []).append(
+            (index, entity_id, device_config.get(CONF_INVERT_VALUE, False), slot)
+        )
+    for entries in bulk_index.values():
+        entries.sort()
+    return bulk_index
+
+
+def push_entity_values(
+    coordinator: IpxDataUpdateCoordinator, entity_id: str, state: str
+) -> dict[Slot, Any] | None:
+    """Return the snapshot values of a state pushed for an entity.
+
+    None if the entity is not one of the gateway or does not support it,
+    its state is then overridden in the state machine as before.
+    """
+    if (entity := coordinator.push_entities.get(entity_id)) is None:
+        return None
+    return entity.push_values(state)
+
+
 def check_api_auth(request, host, password, check_host) -> bool:
     """Check authentication on API call."""
     if check_host and request.remote != host:
@@ -450,28 +575,108 @@ def check_api_auth(request, host, password, check_host) -> bool:
     return True
 
 
-class IpxRequestView(HomeAssistantView):
-    """Provide a page for the device to call."""
-
-    requires_auth = False
-    url = "/api/ipx800v4/{entity_id}/{state}"
-    name = "api:ipx800v4"
+class IpxPushGateway:
+    """Settings and state of a gateway receiving the IPX800 pushes."""
 
-    def __init__(self, name: str, host: str, password: str, check_host: bool) -> None:
-        """Init the IPX view."""
-        self.extra_urls = [f"/api/ipx800v4/{name}/{{entity_id}}/{{state}}"]
+    def __init__(
+        self,
+        name: str,
+        host: str,
+        password: str,
+        check_host: bool,
+        devices: list,
+        coordinator: IpxDataUpdateCoordinator,
+    ) -> None:
+        """Init the push gateway."""
+        self.name = name
         self.host = host
         self.password = password
         self.check_host = check_host
+        self.coordinator = coordinator
+        self.bulk_index = build_bulk_index(devices)
+
+
+class IpxPushRegistry:
+    """Gateways receiving the IPX800 pushes, shared by the push views.
+
+    The views are registered once for the domain: a push is routed to the
+    gateway named in its URL or, without name, to the gateway calling it.
+    """
+
+    def __init__(self) -> None:
+        """Init an empty registry."""
+        self.gateways: dict[str, IpxPushGateway] = {}
+        self._by_name: dict[str, IpxPushGateway] = {}
+        self._by_host: dict[str, IpxPushGateway] = {}
+
+    def add(self, entry_id: str, gateway: IpxPushGateway) -> None:
+        """Route the pushes of a gateway to it."""
+        self.gateways[entry_id] = gateway
+        self._by_name[gateway.name] = gateway
+        self._by_host[gateway.host] = gateway
+
+    def remove(self, entry_id: str) -> None:
+        """Stop routing the pushes of a gateway."""
+        if (gateway := self.gateways.pop(entry_id, None)) is None:
+            return
+        if self._by_name.get(gateway.name) is gateway:
+            del self._by_name[gateway.name]
+        if self._by_host.get(gateway.host) is gateway:
+            del self._by_host[gateway.host]
+
+    def resolve(self, remote: str | None, name: str | None) -> IpxPushGateway | None:
+        """Return the gateway a push is for, None if unknown."""
+        if name is not None:
+            return self._by_name.get(name)
+        if (gateway := self._by_host.get(remote)) is not None:
+            return gateway
+        # A host can be a name, the first gateway then checks the push as before
+        return next(iter(self.gateways.values()), None)
+
+
+class IpxPushView(HomeAssistantView):
+    """Base of the pages the IPX800 calls, for all the gateways."""
+
+    requires_auth = False
+
+    def __init__(self, registry: IpxPushRegistry) -> None:
+        """Init the IPX view."""
+        self.registry = registry
         super().__init__()
 
-    async def get(self, request, entity_id, state):
+    def authorized_gateway(self, request, name: str | None) -> IpxPushGateway | None:
+        """Return the gateway of an authorized push, None otherwise."""
+        gateway = self.registry.resolve(request.remote, name)
+        if gateway is None:
+            _LOGGER.warning(
+                "API call for an unknown IPX800: %s", name or request.remote
+            )
+            return None
+        if not check_api_auth(
+            request, gateway.host, gateway.password, gateway.check_host
+        ):
+            return None
+        return gateway
+
+
+class IpxRequestView(IpxPushView):
+    """Provide a page for the device to call."""
+
+    url = "/api/ipx800v4/{entity_id}/{state}"
+    extra_urls: ClassVar[list[str]] = ["/api/ipx800v4/{name}/{entity_id}/{state}"]
+    name = "api:ipx800v4"
+
+    async def get(self, request, entity_id, state, name=None):
         """Respond to requests from the device."""
-        if not check_api_auth(request, self.host, self.password, self.check_host):
+        if (gateway := self.authorized_gateway(request, name)) is None:
             return web.Response(status=HTTPStatus.UNAUTHORIZED, text="Unauthorized")
         hass = request.app["hass"]
-        old_state = hass.states.get(entity_id)
         _LOGGER.debug("Update %s to state %s", entity_id, state)
+        values = push_entity_values(gateway.coordinator, entity_id, state)
+        if values is not None:
+            gateway.coordinator.async_set_pushed(values)
+            return web.Response(status=HTTPStatus.OK, text="OK")
+        old_state = hass.states.get(entity_id)
         if old_state:
             hass.states.async_set(entity_id, state, old_state.attributes)
             return web.Response(status=HTTPStatus.OK, text="OK")
@@ -479,111 +684,111 @@ class IpxRequestView(HomeAssistantView):
         return None
 
 
-class IpxRequestDataView(HomeAssistantView):
+class IpxRequestDataView(IpxPushView):
     """Provide a page for the device to call for send multiple data at once."""
 
-    requires_auth = False
     url = "/api/ipx800v4_data/{data}"
+    extra_urls: ClassVar[list[str]] = ["/api/ipx800v4_data/{name}/{data}"]
     name = "api:ipx800v4_data"
 
-    def __init__(self, name: str, host: str, password: str, check_host: bool) -> None:
-        """Init the IPX view."""
-        self.extra_urls = [f"/api/ipx800v4_data/{name}/{{data}}"]
-        self.host = host
-        self.password = password
-        self.check_host = check_host
-        super().__init__()
-
-    async def get(self, request, data):
+    async def get(self, request, data, name=None):
         """Respond to requests from the device."""
-        if not check_api_auth(request, self.host, self.password, self.check_host):
+        if (gateway := self.authorized_gateway(request, name)) is None:
             return web.Response(status=HTTPStatus.UNAUTHORIZED, text="Unauthorized")
         hass = request.app["hass"]
-        entities_data = data.split("&")
-        for entity_data in entities_data:
-            entity_id = entity_data.split("=")[0]
-            state = "on" if entity_data.split("=")[1] in ["1", "on", "true"] else "off"
+        pushed: dict = {}
+        for entity_data in data.split("&"):
+            entity_id, _, value = entity_data.partition("=")
+            _LOGGER.debug("Update %s to state %s", entity_id, value)
+            # An entity of the gateway converts the value to its own type
+            values = push_entity_values(gateway.coordinator, entity_id, value)
+            if values is not None:
+                pushed.update(values)
+                continue
+            # Or an IPX800 key without entity, like A1=$A01
+            if (slot := slot_for_key(entity_id)) is not None:
+                if (typed_value := pushed_value(slot, value)) is not None:
+                    pushed[slot] = typed_value
+                else:
+                    _LOGGER.warning("Invalid value for %s: %s", entity_id, value)
+                continue
 
+            state = "on" if value in PUSH_ON_STATES else "off"
             old_state = hass.states.get(entity_id)
-            _LOGGER.debug("Update %s to state %s", entity_id, state)
             if old_state:
                 hass.states.async_set(entity_id, state, old_state.attributes)
             else:
                 _LOGGER.warning("Entity not found for state updating: %s", entity_id)
 
+        if pushed:
+            gateway.coordinator.async_set_pushed(pushed)
         return web.Response(status=HTTPStatus.OK, text="OK")
 
 
-class IpxRequestBulkUpdateView(HomeAssistantView):
+class IpxRequestBulkUpdateView(IpxPushView):
     """Provide a page for the device to call for bulk update all states at once."""
 
-    requires_auth = False
     url = "/api/ipx800v4_bulk/{device_type}/{data}"
+    extra_urls: ClassVar[list[str]] = ["/api/ipx800v4_bulk/{name}/{device_type}/{data}"]
     name = "api:ipx800v4_bulk"
 
-    def __init__(
-        self, name: str, host: str, password: str, check_host: bool, devices: list
-    ) -> None:
-        """Init the IPX view."""
-        self.extra_urls = [f"/api/ipx800v4_bulk/{name}/{{device_type}}/{{data}}"]
-        self.host = host
-        self.password = password
-        self.check_host = check_host
-        self.devices = devices
-        super().__init__()
-
-    async def get(self, request, device_type, data):
+    async def get(self, request, device_type, data, name=None):
         """Respond to requests from the device."""
-        if not check_api_auth(request, self.host, self.password, self.check_host):
+        if (gateway := self.authorized_gateway(request, name)) is None:
             return web.Response(status=HTTPStatus.UNAUTHORIZED, text="Unauthorized")
         hass = request.app["hass"]
-        _LOGGER.debug("Bulk update %s from %s : %s", device_type, self.host, data)
-        for device_config in self.devices:
-            index = int(device_config[CONF_ID]) - 1
-            if device_config[CONF_TYPE] == device_type and 0 <= index < len(data):
-                entity_id = ".".join(
-                    [device_config[CONF_COMPONENT], slugify(device_config[CONF_NAME])]
-                )
-                invert_value = device_config.get(CONF_INVERT_VALUE, False)
-                state = "on" if data[index] == ("0" if invert_value else "1") else "off"
-                old_state = hass.states.get(entity_id)
-                if old_state:
-                    if state != old_state.state:
-                        _LOGGER.debug("Update %s to state %s", entity_id, state)
-                        hass.states.async_set(entity_id, state, old_state.attributes)
-                else:
-                    _LOGGER.warning(
-                        "Entity not found for state updating: %s", entity_id
-                    )
+        coordinator = gateway.coordinator
+        _LOGGER.debug("Bulk update %s from %s : %s", device_type, gateway.host, data)
+        # Only the values whose bit differs from their current value are updated
+        snapshot = coordinator.data
+        pushed: dict = {}
+        groups: set[str] = set()
+        if device_type in BULK_BIT_TYPES:
+            # The bits carry the whole group, whatever devices are configured
+            group = TYPE_GROUPS[device_type]
+            groups.add(group)
+            for index, bit in enumerate(data):
+                if (slot := slot_for_key(f"{group}{index + 1}")) is None:
+                    continue
+                value = int(bit == "1")
+                if snapshot is None or snapshot.get(slot) != value:
+                    pushed[slot] = value
+        for index, entity_id, invert_value, slot in gateway.bulk_index.get(
+            device_type, ()
+        ):
+            if index >= len(data):
+                break
+            # The entities reading the pushed slots are updated by the snapshot
+            if slot is not None and entity_id in coordinator.push_entities:
+                continue
+            state = "on" if data[index] == ("0" if invert_value else "1") else "off"
+            old_state = hass.states.get(entity_id)
+            if old_state:
+                if state != old_state.state:
+                    _LOGGER.debug("Update %s to state %s", entity_id, state)
+                    hass.states.async_set(entity_id, state, old_state.attributes)
+            else:
+                _LOGGER.warning("Entity not found for state updating: %s", entity_id)
+        if pushed or groups:
+            coordinator.async_set_pushed(pushed, groups)
         return web.Response(status=HTTPStatus.OK, text="OK")
 
 
-class IpxRequestRefreshView(HomeAssistantView):
+class IpxRequestRefreshView(IpxPushView):
     """Provide a page for the device to force refresh data from coordinator."""
 
-    requires_auth = False
     url = "/api/ipx800v4_refresh/{data}"
+    extra_urls: ClassVar[list[str]] = ["/api/ipx800v4_refresh/{name}/{data}"]
     name = "api:ipx800v4_refresh"
 
-    def __init__(
-        self,
-        name: str,
-        host: str,
-        password: str,
-        check_host: bool,
-        coordinator: DataUpdateCoordinator,
-    ) -> None:
-        """Init the IPX view."""
-        self.extra_urls = [f"/api/ipx800v4_refresh/{name}/{{data}}"]
-        self.host = host
-        self.password = password
-        self.check_host = check_host
-        self.coordinator = coordinator
-        super().__init__()
-
-    async def get(self, request, data):
+    async def get(self, request, data, name=None):
         """Respond to requests from the device."""
-        if not check_api_auth(request, self.host, self.password, self.check_host):
+        if (gateway := self.authorized_gateway(request, name)) is None:
             return web.Response(status=HTTPStatus.UNAUTHORIZED, text="Unauthorized")
-        await self.coordinator.async_request_refresh()
+        # Only refetch the named groups, like VR or R,D, otherwise everything
+        if groups := parse_refresh_groups(data):
+            _LOGGER.debug("Refresh %s from %s", sorted(groups), gateway.host)
+            await gateway.coordinator.async_refresh_groups(groups)
+        else:
+            await gateway.coordinator.async_request_refresh()
         return web.Response(status=HTTPStatus.OK, text="OK")
@@ -1,6 +1,7 @@
 """Support for IPX800 V4 binary sensors."""
 
 import logging
+from typing import Any
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
@@ -18,6 +19,7 @@ from .const import (
     TYPE_VIRTUALOUT,
 )
 from .entity import IpxEntity
+from .snapshot import Slot
 
 _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = GLOBAL_PARALLEL_UPDATES
@@ -41,36 +43,38 @@ async def async_setup_entry(
         elif device.get(CONF_TYPE) == TYPE_DIGITALIN:
             entities.append(DigitalInBinarySensor(device, controller, coordinator))
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 class VirtualOutBinarySensor(IpxEntity, BinarySensorEntity):
     """Representation of a IPX Virtual Out."""
 
-    @property
-    def available(self) -> bool:
-        """Return True if the virtual output is present in the last update."""
-        return self._data_available(f"VO{self._id}")
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"VO{self._id}",)
+
+    def _push_values(self, state: str) -> dict[Slot, Any] | None:
+        """Convert a pushed state to snapshot values."""
+        return self._push_on_off(state, self._invert_value)
 
     @property
     def is_on(self) -> bool:
         """Return the state."""
-        return self.coordinator.data[f"VO{self._id}"] == (
-            1 if not self._invert_value else 0
-        )
+        return self._value() == (1 if not self._invert_value else 0)
 
 
 class DigitalInBinarySensor(IpxEntity, BinarySensorEntity):
     """Representation of a IPX Virtual In."""
 
-    @property
-    def available(self) -> bool:
-        """Return True if the digital input is present in the last update."""
-        return self._data_available(f"D{self._id}")
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"D{self._id}",)
+
+    def _push_values(self, state: str) -> dict[Slot, Any] | None:
+        """Convert a pushed state to snapshot values."""
+        return self._push_on_off(state, self._invert_value)
 
     @property
     def is_on(self) -> bool:
         """Return the state."""
-        return self.coordinator.data[f"D{self._id}"] == (
-            1 if not self._invert_value else 0
-        )
+        return self._value() == (1 if not self._invert_value else 0)
@@ -2,7 +2,7 @@
 
 import logging
 
-from pypx800 import IPX800, X4FP, Ipx800RequestError, Relay
+from pypx800 import IPX800, X4FP, Ipx800CannotConnectError, Ipx800RequestError, Relay
 
 from homeassistant.components.climate import (
     PRESET_AWAY,
@@ -41,6 +41,16 @@ from .entity import IpxEntity
 _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = GLOBAL_PARALLEL_UPDATES
 
+# Value reported by the IPX800 for each X4FP mode id
+X4FP_MODE_VALUES = {
+    0: IPX_PRESET_COMFORT,
+    1: IPX_PRESET_ECO,
+    2: IPX_PRESET_AWAY,
+    3: IPX_PRESET_NONE,
+    4: f"{IPX_PRESET_COMFORT} -1",
+    5: f"{IPX_PRESET_COMFORT} -2",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -60,7 +70,7 @@ async def async_setup_entry(
         elif device.get(CONF_TYPE) == TYPE_RELAY:
             entities.append(RelayClimate(device, controller, coordinator))
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 class X4FPClimate(IpxEntity, ClimateEntity):
@@ -89,28 +99,21 @@ class X4FPClimate(IpxEntity, ClimateEntity):
             PRESET_COMFORT_MINUS_2,
         ]
 
-    @property
-    def available(self) -> bool:
-        """Return True if the zone data is present in the last update."""
-        return self._data_available(f"FP{self._ext_id} Zone {self._id}")
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"FP{self._ext_id} Zone {self._id}",)
 
     @property
     def hvac_mode(self) -> HVACMode | None:
         """Return current mode if heating or not."""
-        if (
-            self.coordinator.data[f"FP{self._ext_id} Zone {self._id}"]
-            == IPX_PRESET_NONE
-        ):
+        if self._value() == IPX_PRESET_NONE:
             return HVACMode.OFF
         return HVACMode.HEAT
 
     @property
     def hvac_action(self) -> HVACAction | None:
         """Return current action if heating or not."""
-        if (
-            self.coordinator.data[f"FP{self._ext_id} Zone {self._id}"]
-            == IPX_PRESET_NONE
-        ):
+        if self._value() == IPX_PRESET_NONE:
             return HVACAction.OFF
         return HVACAction.HEATING
 
@@ -125,9 +128,7 @@ class X4FPClimate(IpxEntity, ClimateEntity):
             f"{IPX_PRESET_COMFORT} -1": PRESET_COMFORT_MINUS_1,
             f"{IPX_PRESET_COMFORT} -2": PRESET_COMFORT_MINUS_2,
         }
-        return switcher.get(
-            self.coordinator.data.get(f"FP{self._ext_id} Zone {self._id}")  # type: ignore[arg-type]
-        )
+        return switcher.get(self._value())
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new target preset mode."""
@@ -143,9 +144,8 @@ class X4FPClimate(IpxEntity, ClimateEntity):
             "set preset_mode to %s => id %s", preset_mode, switcher.get(preset_mode)
         )
         try:
-            await self.control.set_mode(switcher.get(preset_mode))
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            await self._async_set_mode(switcher.get(preset_mode))
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while set IPX800 climate preset mode: %s", self.name
             )
@@ -154,18 +154,23 @@ class X4FPClimate(IpxEntity, ClimateEntity):
         """Set hvac mode."""
         try:
             if hvac_mode == HVACMode.HEAT:
-                await self.control.set_mode(0)
+                await self._async_set_mode(0)
             elif hvac_mode == HVACMode.OFF:
-                await self.control.set_mode(3)
+                await self._async_set_mode(3)
             else:
                 _LOGGER.error("Unrecognized hvac mode: %s", hvac_mode)
                 return
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while set IPX800 climate hvac mode: %s", self.name
             )
 
+    async def _async_set_mode(self, mode: int | None) -> None:
+        """Set the X4FP mode and show it until confirmed by a poll."""
+        await self.control.set_mode(mode)
+        if (value := X4FP_MODE_VALUES.get(mode)) is not None:  # type: ignore[arg-type]
+            self._async_commanded({self._slot(): value})
+
 
 class RelayClimate(IpxEntity, ClimateEntity):
     """Representation of a IPX Climate through 2 relais."""
@@ -190,36 +195,29 @@ class RelayClimate(IpxEntity, ClimateEntity):
         self._attr_hvac_modes = [HVACMode.HEAT, HVACMode.OFF]
         self._attr_preset_modes = [PRESET_COMFORT, PRESET_ECO, PRESET_AWAY, PRESET_NONE]
 
-    @property
-    def available(self) -> bool:
-        """Return True if both relay states are present in the last update."""
-        return self._data_available(f"R{self._ids[0]}", f"R{self._ids[1]}")
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"R{self._ids[0]}", f"R{self._ids[1]}")
 
     @property
     def hvac_mode(self) -> HVACMode | None:
         """Return current mode if heating or not."""
-        if (
-            int(self.coordinator.data[f"R{self._ids[0]}"]) == 0
-            and int(self.coordinator.data[f"R{self._ids[1]}"]) == 1
-        ):
+        if self._value(0) == 0 and self._value(1) == 1:
             return HVACMode.OFF
         return HVACMode.HEAT
 
     @property
     def hvac_action(self) -> HVACAction | None:
         """Return current action if heating or not."""
-        if (
-            int(self.coordinator.data[f"R{self._ids[0]}"]) == 0
-            and int(self.coordinator.data[f"R{self._ids[1]}"]) == 1
-        ):
+        if self._value(0) == 0 and self._value(1) == 1:
             return HVACAction.OFF
         return HVACAction.HEATING
 
     @property
     def preset_mode(self) -> str | None:
         """Return current preset mode from 2 relay states."""
-        state_minus = int(self.coordinator.data[f"R{self._ids[0]}"])
-        state_plus = int(self.coordinator.data[f"R{self._ids[1]}"])
+        state_minus = self._value(0)
+        state_plus = self._value(1)
         switcher = {
             (0, 0): PRESET_COMFORT,
             (0, 1): PRESET_NONE,
@@ -240,16 +238,13 @@ class RelayClimate(IpxEntity, ClimateEntity):
         """Set hvac mode."""
         try:
             if hvac_mode == HVACMode.HEAT:
-                await self.control_minus.off()
-                await self.control_plus.off()
+                await self._async_set_relays(False, False)
             elif hvac_mode == HVACMode.OFF:
-                await self.control_minus.off()
-                await self.control_plus.on()
+                await self._async_set_relays(False, True)
             else:
                 _LOGGER.error("Unrecognized hvac mode: %s", hvac_mode)
                 return
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while set IPX800 climate hvac mode: %s", self.name
             )
@@ -258,19 +253,26 @@ class RelayClimate(IpxEntity, ClimateEntity):
         """Set target preset mode."""
         try:
             if preset_mode == PRESET_COMFORT:
-                await self.control_minus.off()
-                await self.control_plus.off()
+                await self._async_set_relays(False, False)
             elif preset_mode == PRESET_ECO:
-                await self.control_minus.on()
-                await self.control_plus.on()
+                await self._async_set_relays(True, True)
             elif preset_mode == PRESET_AWAY:
-                await self.control_minus.on()
-                await self.control_plus.off()
+                await self._async_set_relays(True, False)
             else:
-                await self.control_minus.off()
-                await self.control_plus.on()
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+                await self._async_set_relays(False, True)
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while set IPX800 climate preset mode: %s", self.name
             )
+
+    async def _async_set_relays(self, minus: bool, plus: bool) -> None:
+        """Set both relays and show them until confirmed by a poll."""
+        if minus:
+            await self.control_minus.on()
+        else:
+            await self.control_minus.off()
+        if plus:
+            await self.control_plus.on()
+        else:
+            await self.control_plus.off()
+        self._async_commanded({self._slot(0): int(minus), self._slot(1): int(plus)})
@@ -15,7 +15,14 @@ from homeassistant.config_entries import (
 from homeassistant.const import CONF_NAME, CONF_SCAN_INTERVAL
 from homeassistant.core import callback
 
-from .const import COORDINATOR, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import (
+    CONF_COUNTER_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_SLOW_SCAN_INTERVAL,
+    COORDINATOR,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+)
 
 
 @HANDLERS.register(DOMAIN)
@@ -62,20 +69,47 @@ class Ipx800OptionsFlowHandler(OptionsFlow):
     """Handle a IPX800 options flow."""
 
     async def async_step_init(self, user_input=None) -> ConfigFlowResult:
-        """Manage the options."""
+        """Manage the options.
+
+        The slow and counter intervals are only stored when they differ from
+        the scan interval, so they follow it when it changes. An empty field
+        is stored as None to unset the option, even if set in YAML.
+        """
         if user_input is not None:
             coordinator = self.hass.data[DOMAIN][self.config_entry.entry_id][
                 COORDINATOR
             ]
-            update_interval_sec = user_input[CONF_SCAN_INTERVAL]
+            scan_interval = user_input[CONF_SCAN_INTERVAL]
+            options = {CONF_SCAN_INTERVAL: scan_interval}
+            for key in (CONF_SLOW_SCAN_INTERVAL, CONF_COUNTER_SCAN_INTERVAL):
+                value = user_input.get(key)
+                options[key] = None if value == scan_interval else value
+            options[CONF_MIN_SCAN_INTERVAL] = user_input.get(CONF_MIN_SCAN_INTERVAL)
+            update_interval_sec = min(
+                scan_interval,
+                options[CONF_SLOW_SCAN_INTERVAL] or scan_interval,
+                options[CONF_COUNTER_SCAN_INTERVAL] or scan_interval,
+            )
             update_interval = timedelta(seconds=update_interval_sec)
             coordinator.update_interval = update_interval
-            return self.async_create_entry(title="", data=user_input)
+            return self.async_create_entry(title="", data=options)
 
         scan_interval = self.config_entry.options.get(
             CONF_SCAN_INTERVAL,
             self.config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
         )
+        slow_scan_interval = self.config_entry.options.get(
+            CONF_SLOW_SCAN_INTERVAL,
+            self.config_entry.data.get(CONF_SLOW_SCAN_INTERVAL),
+        )
+        counter_scan_interval = self.config_entry.options.get(
+            CONF_COUNTER_SCAN_INTERVAL,
+            self.config_entry.data.get(CONF_COUNTER_SCAN_INTERVAL),
+        )
+        min_scan_interval = self.config_entry.options.get(
+            CONF_MIN_SCAN_INTERVAL,
+            self.config_entry.data.get(CONF_MIN_SCAN_INTERVAL),
+        )
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
@@ -84,6 +118,20 @@ class Ipx800OptionsFlowHandler(OptionsFlow):
                         CONF_SCAN_INTERVAL,
                         default=scan_interval,
                     ): int,
+                    # Empty to follow the scan interval
+                    vol.Optional(
+                        CONF_SLOW_SCAN_INTERVAL,
+                        description={"suggested_value": slow_scan_interval},
+                    ): vol.All(int, vol.Range(min=1)),
+                    vol.Optional(
+                        CONF_COUNTER_SCAN_INTERVAL,
+                        description={"suggested_value": counter_scan_interval},
+                    ): vol.All(int, vol.Range(min=1)),
+                    # Empty to keep the scan interval fixed
+                    vol.Optional(
+                        CONF_MIN_SCAN_INTERVAL,
+                        description={"suggested_value": min_scan_interval},
+                    ): vol.All(int, vol.Range(min=1)),
                 }
             ),
         )
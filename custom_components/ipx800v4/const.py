@@ -5,14 +5,62 @@ DOMAIN = "ipx800v4"
 CONTROLLER = "controller"
 COORDINATOR = "coordinator"
 UNDO_UPDATE_LISTENER = "undo_update_listener"
+POLL_STAGGER = "poll_stagger"
+PUSH_REGISTRY = "push_registry"
 GLOBAL_PARALLEL_UPDATES = 1
+DEFAULT_MAX_REQUESTS = 1
+DEFAULT_REQUEST_TIMEOUT = 10
+COMMAND_BATCH_DELAY = 0.05
+
+# HTTP connections, times in seconds
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 30
+LATENCY_SMOOTHING = 0.2
+
+# Circuit breaker of unreachable gateways, times in seconds
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_BACKOFF_MIN = 5
+CIRCUIT_BACKOFF_MAX = 300
+
+# M2M transport, times in seconds
+TRANSPORT_HTTP = "http"
+TRANSPORT_M2M = "m2m"
+DEFAULT_M2M_PORT = 9870
+M2M_TIMEOUT = 10
+M2M_BACKOFF_MIN = 1
+M2M_BACKOFF_MAX = 60
 PUSH_USERNAME = "ipx800"
 
 DEFAULT_SCAN_INTERVAL = 10
+DEFAULT_PUSH_VERIFY_INTERVAL = 300
 DEFAULT_TRANSITION = 0.5
+DEFAULT_TRAVEL_TIME = 30
 REQUEST_REFRESH_DELAY = 0.5
+# Longest wait of a requested refresh while commands keep coming
+REQUEST_REFRESH_MAX_DELAY = 3
+
+# Adaptive scan interval, times in seconds
+ADAPTIVE_FAST_LATENCY = 0.3
+ADAPTIVE_SLOW_LATENCY = 1.5
+ADAPTIVE_MAX_ERROR_RATE = 0.05
+ADAPTIVE_TIGHTEN_FACTOR = 0.9
+ADAPTIVE_BACKOFF_FACTOR = 2
+ADAPTIVE_JITTER = 0.1
+ADAPTIVE_MAX_INTERVAL = 300
+
+# Last snapshot saved to restore the entities at startup
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 60
+
+# Cover motion tracking, in seconds
+COVER_POLL_INTERVAL = 2
+COVER_TILT_TIME = 2
+COVER_MOTION_GRACE = 4
+COVER_MOTION_TIMEOUT = 120
 
 CONF_DEVICES = "devices"
+CONF_COUNTER_SCAN_INTERVAL = "counter_scan_interval"
+CONF_SLOW_SCAN_INTERVAL = "slow_scan_interval"
 
 CONF_COMPONENT = "component"
 CONF_DEFAULT_BRIGHTNESS = "default_brightness"
@@ -20,9 +68,17 @@ CONF_ID = "id"
 CONF_IDS = "ids"
 CONF_EXT_ID = "ext_id"
 CONF_INVERT_VALUE = "invert_value"
+CONF_M2M_PORT = "m2m_port"
+CONF_MAX_CONNECTIONS = "max_connections"
+CONF_MIN_SCAN_INTERVAL = "min_scan_interval"
 CONF_PUSH_PASSWORD = "push_password"
 CONF_PUSH_CHECK_HOST = "push_check_host"
+CONF_PUSH_HEARTBEAT = "push_heartbeat"
+CONF_PUSH_VERIFY_INTERVAL = "push_verify_interval"
+CONF_REQUEST_TIMEOUT = "request_timeout"
 CONF_TRANSITION = "transition"
+CONF_TRANSPORT = "transport"
+CONF_TRAVEL_TIME = "travel_time"
 CONF_TYPE = "type"
 
 TYPE_RELAY = "relay"
@@ -61,6 +117,87 @@ CONF_TYPE_ALLOWED = [
     TYPE_COUNTER,
 ]
 
+# Endpoint groups of the IPX800 API, named after the key prefix of their values
+GROUP_RELAY = "R"
+GROUP_DIGITALIN = "D"
+GROUP_ANALOGIN = "A"
+GROUP_VIRTUALIN = "VI"
+GROUP_VIRTUALOUT = "VO"
+GROUP_VIRTUALANALOGIN = "VA"
+GROUP_COUNTER = "C"
+GROUP_XPWM = "PWM"
+GROUP_XDIMMER = "G"
+GROUP_X4VR = "VR"
+GROUP_X4FP = "FP"
+GROUP_XTHL = "THL"
+GROUP_XENO = "ENO"
+
+# Value of the Get parameter to fetch each group
+GROUP_ALL = "all"
+GROUP_REQUESTS = {
+    GROUP_RELAY: "R",
+    GROUP_DIGITALIN: "D",
+    GROUP_ANALOGIN: "A",
+    GROUP_VIRTUALIN: "VI",
+    GROUP_VIRTUALOUT: "VO",
+    GROUP_VIRTUALANALOGIN: "VA",
+    GROUP_COUNTER: "C",
+    GROUP_XPWM: "XPWM|1-24",
+    GROUP_XDIMMER: "G",
+    GROUP_X4VR: "VR",
+    GROUP_X4FP: "FP",
+    GROUP_XTHL: "XTHL",
+    GROUP_XENO: "XENO",
+}
+
+# Groups returned by a single Get=all request
+GROUPS_IN_ALL = {
+    GROUP_RELAY,
+    GROUP_DIGITALIN,
+    GROUP_ANALOGIN,
+    GROUP_VIRTUALIN,
+    GROUP_VIRTUALOUT,
+    GROUP_VIRTUALANALOGIN,
+    GROUP_XDIMMER,
+    GROUP_X4VR,
+    GROUP_X4FP,
+    GROUP_XTHL,
+    GROUP_XENO,
+}
+# Groups polled with the slow and counter scan intervals, others use scan_interval
+SLOW_POLL_GROUPS = {
+    GROUP_ANALOGIN,
+    GROUP_VIRTUALANALOGIN,
+    GROUP_XTHL,
+    GROUP_XENO,
+}
+COUNTER_POLL_GROUPS = {GROUP_COUNTER}
+
+# Use Get=all instead of separated requests from this number of groups
+POLL_ALL_THRESHOLD = 4
+
+TYPE_GROUPS = {
+    TYPE_RELAY: GROUP_RELAY,
+    TYPE_XPWM: GROUP_XPWM,
+    TYPE_XPWM_RGB: GROUP_XPWM,
+    TYPE_XPWM_RGBW: GROUP_XPWM,
+    TYPE_XDIMMER: GROUP_XDIMMER,
+    TYPE_VIRTUALOUT: GROUP_VIRTUALOUT,
+    TYPE_VIRTUALIN: GROUP_VIRTUALIN,
+    TYPE_ANALOGIN: GROUP_ANALOGIN,
+    TYPE_VIRTUALANALOGIN: GROUP_VIRTUALANALOGIN,
+    TYPE_DIGITALIN: GROUP_DIGITALIN,
+    TYPE_X4VR: GROUP_X4VR,
+    TYPE_X4VR_BSO: GROUP_X4VR,
+    TYPE_XENO: GROUP_XENO,
+    TYPE_XTHL: GROUP_XTHL,
+    TYPE_X4FP: GROUP_X4FP,
+    TYPE_COUNTER: GROUP_COUNTER,
+}
+
+# Types pushed in bulk as a string of 0/1, one char per id
+BULK_BIT_TYPES = {TYPE_RELAY, TYPE_DIGITALIN, TYPE_VIRTUALIN, TYPE_VIRTUALOUT}
+
 IPX_PRESET_NONE = "Arret"
 IPX_PRESET_ECO = "Eco"
 IPX_PRESET_AWAY = "Hors Gel"
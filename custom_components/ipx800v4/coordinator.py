@@ -0,0 +1,693 @@
+"""Data update coordinator for the GCE IPX800 V4."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Collection, Mapping, Sequence
+from datetime import timedelta
+import logging
+from math import ceil, inf
+from random import uniform
+from time import monotonic
+from typing import Any
+import zlib
+
+from pypx800 import (
+    Ipx800CannotConnectError,
+    Ipx800InvalidAuthError,
+    Ipx800RequestError,
+)
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import (
+    ADAPTIVE_BACKOFF_FACTOR,
+    ADAPTIVE_FAST_LATENCY,
+    ADAPTIVE_JITTER,
+    ADAPTIVE_MAX_ERROR_RATE,
+    ADAPTIVE_MAX_INTERVAL,
+    ADAPTIVE_SLOW_LATENCY,
+    ADAPTIVE_TIGHTEN_FACTOR,
+    CONF_TYPE,
+    COUNTER_POLL_GROUPS,
+    DEFAULT_PUSH_VERIFY_INTERVAL,
+    DOMAIN,
+    GROUP_ALL,
+    GROUP_REQUESTS,
+    GROUPS_IN_ALL,
+    LATENCY_SMOOTHING,
+    POLL_ALL_THRESHOLD,
+    REQUEST_REFRESH_DELAY,
+    REQUEST_REFRESH_MAX_DELAY,
+    SLOW_POLL_GROUPS,
+    SNAPSHOT_SAVE_DELAY,
+    TYPE_GROUPS,
+)
+from .gateway import PRIORITY_POLL, IpxGateway, parse_api_response
+from .snapshot import COLUMNS, IpxSnapshot, Slot, columns_for_groups, slot_for_key
+
+_LOGGER = logging.getLogger(__name__)
+
+# Group fetched by each request, except Get=all
+REQUEST_GROUPS = {request: group for group, request in GROUP_REQUESTS.items()}
+
+
+def build_poll_groups(devices: list) -> set[str]:
+    """Return the endpoint groups read by at least one configured device."""
+    return {TYPE_GROUPS[device[CONF_TYPE]] for device in devices}
+
+
+def build_group_intervals(
+    groups: set[str],
+    scan_interval: int,
+    slow_scan_interval: int,
+    counter_scan_interval: int,
+) -> dict[str, int]:
+    """Return the polling interval in seconds of each group."""
+    intervals = {}
+    for group in groups:
+        if group in SLOW_POLL_GROUPS:
+            intervals[group] = slow_scan_interval
+        elif group in COUNTER_POLL_GROUPS:
+            intervals[group] = counter_scan_interval
+        else:
+            intervals[group] = scan_interval
+    return intervals
+
+
+def build_poll_requests(groups: set[str]) -> list[str]:
+    """Return the Get parameters to request to fetch all the groups.
+
+    A single Get=all request is cheaper for the IPX800 than many small ones,
+    so it is used as soon as enough of the groups it covers are needed.
+    """
+    in_all = groups & GROUPS_IN_ALL
+    if len(in_all) >= POLL_ALL_THRESHOLD:
+        return [GROUP_ALL, *sorted(GROUP_REQUESTS[g] for g in groups - in_all)]
+    return sorted(GROUP_REQUESTS[g] for g in groups)
+
+
+def parse_refresh_groups(data: str) -> set[str]:
+    """Return the groups named in a comma separated list.
+
+    Names can be groups (VR, R), their API request (XTHL), device types
+    (x4vr, relay) or keys (R3, VR1-2). Unknown names are ignored.
+    """
+    groups = set()
+    for name in data.split(","):
+        name = name.strip()
+        if name.upper() in GROUP_REQUESTS:
+            groups.add(name.upper())
+        elif name.upper() in REQUEST_GROUPS:
+            groups.add(REQUEST_GROUPS[name.upper()])
+        elif name.lower() in TYPE_GROUPS:
+            groups.add(TYPE_GROUPS[name.lower()])
+        elif (slot := slot_for_key(name)) is not None:
+            groups.add(COLUMNS[slot[0]][0])
+    return groups
+
+
+def _cell(values: Sequence, present: bytearray, cell: int) -> Any:
+    """Return the value of a cell of a column, None if not present."""
+    if cell < len(present) and present[cell]:
+        return values[cell]
+    return None
+
+
+class IpxPollStagger:
+    """Spread the polls of all the gateways over their interval.
+
+    Each coordinator polls at its own phase of the loop clock, an even
+    fraction of its interval, so gateways with the same interval never poll
+    at the same time. Phases are rebalanced when a gateway is added or
+    removed, and applied from the next scheduled refresh.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the stagger."""
+        self._coordinators: list[IpxDataUpdateCoordinator] = []
+
+    def add(self, coordinator: IpxDataUpdateCoordinator) -> None:
+        """Give a phase to a coordinator."""
+        self._coordinators.append(coordinator)
+
+    def remove(self, coordinator: IpxDataUpdateCoordinator) -> None:
+        """Free the phase of a coordinator."""
+        if coordinator in self._coordinators:
+            self._coordinators.remove(coordinator)
+
+    def phase(self, coordinator: IpxDataUpdateCoordinator) -> float:
+        """Return the fraction of its interval at which a coordinator polls."""
+        if coordinator not in self._coordinators:
+            return 0.0
+        return self._coordinators.index(coordinator) / len(self._coordinators)
+
+
+class IpxDataUpdateCoordinator(DataUpdateCoordinator[IpxSnapshot]):
+    """Coordinate the polling of the IPX800 groups used by the devices.
+
+    Each group has its own polling interval: the coordinator ticks at the
+    shortest one and only fetches the groups that are due, merging them into
+    the previous data so entities always read one coherent snapshot. A
+    requested refresh, like the push refresh endpoint, fetches them all.
+
+    Entities register the snapshot slots they read as listener context, so
+    after a refresh only the entities whose slots changed are notified.
+
+    After a command, entities set the expected values of the commanded slots
+    as shadow values: they are shown at once and confirmed or rolled back by
+    the next poll of their group, instead of refreshing everything. Values
+    pushed by the IPX800 are merged the same way.
+
+    The last polled snapshot is saved, so entities can be restored from it
+    at startup: it is flagged as stale until the first poll succeeds.
+
+    With a minimum scan interval, the scan interval adapts to the IPX800:
+    it tightens toward the minimum while the IPX800 answers fast and
+    without errors, and backs off exponentially when it slows down or
+    fails. The groups polled at the scan interval follow it, the others
+    keep their own interval unless the backoff goes beyond it.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        ipx: IpxGateway,
+        group_intervals: dict[str, int],
+        scan_interval: int,
+        push_heartbeat: int | None = None,
+        push_verify_interval: int = DEFAULT_PUSH_VERIFY_INTERVAL,
+        store: Store | None = None,
+        stagger: IpxPollStagger | None = None,
+        min_scan_interval: int | None = None,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(
+                seconds=min(group_intervals.values(), default=scan_interval)
+            ),
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_DELAY,
+                immediate=False,
+            ),
+        )
+        self.ipx = ipx
+        self.groups = set(group_intervals)
+        self.group_intervals = group_intervals
+        self.base_scan_interval = scan_interval
+        self.min_scan_interval = min_scan_interval
+        # Scan interval in use, adapted if min_scan_interval is set
+        self.scan_interval: float = max(scan_interval, min_scan_interval or 0)
+        self.error_rate = 0.0
+        self._backed_off = False
+        self.push_heartbeat = push_heartbeat
+        self.push_verify_interval = push_verify_interval
+        self._last_poll: dict[str, float] = {}
+        # Checksum of the last response of each request
+        self._fingerprints: dict[str, int] = {}
+        self._pending_groups: set[str] = set()
+        # Time of the first and last requests of the pending groups
+        self._pending_since = 0.0
+        self._pending_last = 0.0
+        self._groups_refresh_task: asyncio.Task | None = None
+        # Refresh in flight of each group, shared by the concurrent callers
+        self._group_refreshes: dict[str, asyncio.Future[None]] = {}
+        # Set by a requested refresh, which fetches all groups, due or not
+        self._refresh_all = False
+        self._slot_listeners: dict[int, dict[int, list[CALLBACK_TYPE]]] = {}
+        self._unkeyed_listeners: list[CALLBACK_TYPE] = []
+        self._notified_data: IpxSnapshot | None = None
+        self._notified_success: bool | None = None
+        self._notified_stale = False
+        self._notified_scan_interval = self.scan_interval
+        if min_scan_interval is not None:
+            self._set_scan_interval(self.scan_interval)
+        self._shadow: dict[Slot, tuple[Any, float]] = {}
+        # Time of the last bulk push of each group, and the entities it can target
+        self.last_group_push: dict[str, float] = {}
+        self.push_entities: dict[str, Any] = {}
+        self._store = store
+        self._stagger = stagger
+        # True while the data is the saved snapshot, not polled yet
+        self.stale = False
+        _LOGGER.debug("Poll plan for %s: %s", ipx.host, group_intervals)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, indexed by the snapshot slots in context."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        slots: tuple[Slot, ...] = context or ()
+        for column, cell in slots:
+            self._slot_listeners.setdefault(column, {}).setdefault(cell, []).append(
+                update_callback
+            )
+        if not slots:
+            self._unkeyed_listeners.append(update_callback)
+
+        @callback
+        def remove_indexed_listener() -> None:
+            """Remove update listener."""
+            remove_listener()
+            for column, cell in slots:
+                cells = self._slot_listeners[column]
+                cells[cell].remove(update_callback)
+                if not cells[cell]:
+                    del cells[cell]
+                if not cells:
+                    del self._slot_listeners[column]
+            if not slots:
+                self._unkeyed_listeners.remove(update_callback)
+
+        return remove_indexed_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update only the listeners whose snapshot slots changed."""
+        previous = self._notified_data
+        # The stale flag is shown by all entities
+        success_changed = (
+            self._notified_success != self.last_update_success
+            or self._notified_stale != self.stale
+        )
+        self._notified_data = self.data
+        self._notified_success = self.last_update_success
+        self._notified_stale = self.stale
+        # The adapted scan interval is shown by an entity of the gateway
+        interval_changed = self._notified_scan_interval != self.scan_interval
+        self._notified_scan_interval = self.scan_interval
+        if self.data is not previous:
+            self._async_schedule_save()
+
+        if previous is None or self.data is None or success_changed:
+            super().async_update_listeners()
+            return
+        if previous is self.data and not interval_changed:
+            return
+
+        data = self.data
+        to_update: dict[CALLBACK_TYPE, None] = {}
+        changed = False
+        for column in range(len(data.values)):
+            new_values, old_values = data.values[column], previous.values[column]
+            new_present, old_present = data.present[column], previous.present[column]
+            # Columns are shared between snapshots when not updated
+            if (new_values is old_values and new_present is old_present) or (
+                new_values == old_values and new_present == old_present
+            ):
+                continue
+            changed = True
+            for cell, listeners in self._slot_listeners.get(column, {}).items():
+                if _cell(new_values, new_present, cell) != _cell(
+                    old_values, old_present, cell
+                ):
+                    to_update.update(dict.fromkeys(listeners))
+        if (changed or interval_changed) and self._unkeyed_listeners:
+            to_update.update(dict.fromkeys(self._unkeyed_listeners))
+
+        for update_callback in to_update:
+            update_callback()
+
+    @callback
+    def _schedule_refresh(self) -> None:
+        """Schedule the next refresh at the phase of the gateway."""
+        if self._stagger is None or self.update_interval is None:
+            super()._schedule_refresh()
+            return
+        if self.config_entry and self.config_entry.pref_disable_polling:
+            return
+        self._async_unsub_refresh()
+        interval = self.update_interval.total_seconds()
+        phase = self._stagger.phase(self) * interval
+        loop = self.hass.loop
+        # The first tick at the phase, at least half an interval from now
+        next_refresh = phase + interval * ceil(
+            (loop.time() + interval / 2 - phase) / interval
+        )
+        self._unsub_refresh = loop.call_at(
+            next_refresh, self._handle_staggered_refresh
+        ).cancel
+
+    @callback
+    def _handle_staggered_refresh(self) -> None:
+        """Run the refresh scheduled at the phase of the gateway."""
+        self.hass.async_create_task(self._handle_refresh_interval(), eager_start=True)
+
+    async def async_restore(self) -> bool:
+        """Restore the saved snapshot as stale data, return True if restored."""
+        if self._store is None or (stored := await self._store.async_load()) is None:
+            return False
+        if (snapshot := IpxSnapshot.from_dict(stored)) is None:
+            _LOGGER.debug("Ignore the invalid saved snapshot of %s", self.ipx.host)
+            return False
+        self.data = snapshot
+        self.stale = True
+        return True
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Save the snapshot once the updates calm down."""
+        if self._store is not None and self.data is not None and not self.stale:
+            self._store.async_delay_save(self.data.as_dict, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def async_set_shadow(self, updates: Mapping[Slot, Any]) -> None:
+        """Show the expected values of commanded slots until they are polled."""
+        self._async_patch(updates, monotonic())
+
+    @callback
+    def async_set_pushed(
+        self, updates: Mapping[Slot, Any], groups: Collection[str] = ()
+    ) -> None:
+        """Merge values pushed by the IPX800 into the snapshot.
+
+        Like shadow values, a poll started before the push cannot override
+        them, while a later poll is more recent and wins. Groups are the
+        groups whose whole values were pushed, even if none changed.
+        """
+        now = monotonic()
+        for group in groups:
+            self.last_group_push[group] = now
+        if updates:
+            self._async_patch(updates, now)
+
+    def group_interval(self, group: str, now: float) -> int:
+        """Return the current polling interval of a group.
+
+        While the whole group is pushed within the heartbeat, polling it is
+        only a verification to catch missed pushes.
+        """
+        interval = self._adapted_interval(self.group_intervals[group])
+        if (
+            self.push_heartbeat is not None
+            and now - self.last_group_push.get(group, -inf) <= self.push_heartbeat
+        ):
+            return max(interval, self.push_verify_interval)
+        return interval
+
+    def _adapted_interval(self, interval: float) -> float:
+        """Return a configured polling interval with the adapted scan interval."""
+        if self.min_scan_interval is None:
+            return interval
+        if interval == self.base_scan_interval:
+            return self.scan_interval
+        return max(interval, self.scan_interval)
+
+    def _set_scan_interval(self, scan_interval: float) -> None:
+        """Use a new adapted scan interval and tick accordingly."""
+        self.scan_interval = scan_interval
+        self.update_interval = timedelta(
+            seconds=min(
+                map(self._adapted_interval, self.group_intervals.values()),
+                default=scan_interval,
+            )
+        )
+
+    def _adapt_scan_interval(self, failed: bool) -> None:
+        """Tighten or back off the scan interval after a poll."""
+        if self.min_scan_interval is None:
+            return
+        self.error_rate += LATENCY_SMOOTHING * (failed - self.error_rate)
+        latency = self.ipx.last_latency
+        if failed or (latency is not None and latency >= ADAPTIVE_SLOW_LATENCY):
+            scan_interval = (
+                self.scan_interval
+                * ADAPTIVE_BACKOFF_FACTOR
+                * uniform(1 - ADAPTIVE_JITTER, 1 + ADAPTIVE_JITTER)
+            )
+            self._backed_off = True
+        elif self._backed_off:
+            # Back to the configured interval at once, tightening from there
+            scan_interval = min(self.scan_interval, self.base_scan_interval)
+            self._backed_off = False
+        elif (
+            latency is not None
+            and latency <= ADAPTIVE_FAST_LATENCY
+            and self.error_rate <= ADAPTIVE_MAX_ERROR_RATE
+        ):
+            scan_interval = self.scan_interval * ADAPTIVE_TIGHTEN_FACTOR
+        else:
+            return
+        scan_interval = min(
+            max(scan_interval, self.min_scan_interval),
+            max(ADAPTIVE_MAX_INTERVAL, self.base_scan_interval),
+        )
+        if scan_interval != self.scan_interval:
+            _LOGGER.debug(
+                "Scan interval of %s set to %.1fs (latency %s, error rate %.2f)",
+                self.ipx.host,
+                scan_interval,
+                latency,
+                self.error_rate,
+            )
+            self._set_scan_interval(scan_interval)
+
+    @callback
+    def _async_patch(self, updates: Mapping[Slot, Any], now: float) -> None:
+        """Patch the snapshot until the next poll of the slots."""
+        self._forget_fingerprints({column for column, _ in updates})
+        self.data = (self.data or IpxSnapshot()).patched(updates)
+        for slot, value in updates.items():
+            # An invalid value is not patched, so it has nothing to shadow
+            if self.data.get(slot) == value:
+                self._shadow[slot] = (value, now)
+        self.async_update_listeners()
+
+    def _reconcile_shadow(
+        self, data: IpxSnapshot, columns: set[int], started: float
+    ) -> IpxSnapshot:
+        """Confirm or roll back the shadow values of the polled columns.
+
+        A poll started before a command may return the state from before it,
+        so the shadow values of later commands are kept for the next poll.
+        """
+        keep: dict[Slot, Any] = {}
+        for slot, (value, commanded) in list(self._shadow.items()):
+            if slot[0] not in columns:
+                continue
+            if commanded >= started:
+                keep[slot] = value
+                continue
+            del self._shadow[slot]
+            if data.get(slot) != value:
+                _LOGGER.debug(
+                    "Roll back slot %s from %s to polled %s",
+                    slot,
+                    value,
+                    data.get(slot),
+                )
+        if not keep:
+            return data
+        self._forget_fingerprints({column for column, _ in keep})
+        return data.patched(keep)
+
+    def _due_groups(self, now: float) -> set[str]:
+        """Return the groups to fetch on this refresh."""
+        if self._refresh_all or self.update_interval is None:
+            return set(self.groups)
+        # Tolerate a half tick of jitter so a group is not delayed by a full tick
+        tolerance = self.update_interval.total_seconds() / 2
+        return {
+            group
+            for group in self.groups
+            if self._last_poll.get(group, -inf) + self.group_interval(group, now)
+            <= now + tolerance
+        }
+
+    async def _async_fetch_groups(
+        self, groups: set[str]
+    ) -> tuple[dict, set[str], set[str]]:
+        """Fetch groups from API.
+
+        Return the values, the groups really fetched and, among them, the
+        groups whose response changed since their last fetch: an unchanged
+        response is not decoded.
+        """
+        data: dict = {}
+        fetched = set(groups)
+        changed = set()
+        for request in build_poll_requests(groups):
+            if request == GROUP_ALL:
+                request_groups = self.groups & GROUPS_IN_ALL
+            else:
+                request_groups = {REQUEST_GROUPS[request]}
+            fetched |= request_groups
+            # Queued behind any pending command on the gateway
+            body = await self.ipx.request_api_raw(
+                {"Get": request}, priority=PRIORITY_POLL
+            )
+            fingerprint = zlib.crc32(body)
+            if self._fingerprints.get(request) == fingerprint:
+                continue
+            data.update(parse_api_response(body))
+            # The other requests of these groups no longer match the snapshot
+            self._forget_fingerprints(columns_for_groups(request_groups))
+            self._fingerprints[request] = fingerprint
+            changed |= request_groups
+        return data, fetched, changed
+
+    def _forget_fingerprints(self, columns: Collection[int]) -> None:
+        """Decode the next responses of the groups of columns.
+
+        Their values in the snapshot no longer match the last responses.
+        """
+        for column in columns:
+            group = COLUMNS[column][0]
+            self._fingerprints.pop(GROUP_REQUESTS[group], None)
+            if group in GROUPS_IN_ALL:
+                self._fingerprints.pop(GROUP_ALL, None)
+
+    def _merge_groups(
+        self, values: dict, fetched: set[str], changed: set[str], started: float
+    ) -> IpxSnapshot:
+        """Return the current data updated with the fetched groups."""
+        for group in fetched:
+            self._last_poll[group] = started
+        if not changed and self.data is not None:
+            # Nothing was due or nothing changed, no shadow value to reconcile
+            return self.data
+
+        # Changed groups are replaced, so values missing from them vanish
+        columns = columns_for_groups(changed)
+        data = (self.data or IpxSnapshot()).merged(values, replace=columns)
+        return self._reconcile_shadow(data, columns, started)
+
+    def last_poll(self, group: str) -> float:
+        """Return the monotonic time the last fetch of a group started."""
+        return self._last_poll.get(group, -inf)
+
+    async def async_refresh_groups(self, groups: set[str]) -> None:
+        """Fetch some groups now, between two regular refreshes.
+
+        A group already being refreshed is not fetched again, the call waits
+        for that refresh instead. Errors are only logged: the regular refresh
+        reports the gateway as unavailable if it fails too.
+        """
+        groups = groups & self.groups
+        if not groups or self.data is None:
+            return
+        in_flight = {
+            self._group_refreshes[group]
+            for group in groups
+            if group in self._group_refreshes
+        }
+        groups -= self._group_refreshes.keys()
+        if groups:
+            done = self.hass.loop.create_future()
+            for group in groups:
+                self._group_refreshes[group] = done
+            try:
+                await self._async_refresh_groups(groups)
+            finally:
+                for group in groups:
+                    del self._group_refreshes[group]
+                done.set_result(None)
+        if in_flight:
+            await asyncio.wait(in_flight)
+
+    async def _async_refresh_groups(self, groups: set[str]) -> None:
+        """Fetch some groups and notify the listeners."""
+        started = monotonic()
+        try:
+            values, fetched, changed = await self._async_fetch_groups(groups)
+        except (
+            Ipx800CannotConnectError,
+            Ipx800InvalidAuthError,
+            Ipx800RequestError,
+        ) as err:
+            _LOGGER.debug("Failed to refresh %s: %s", sorted(groups), err)
+            return
+        self.data = self._merge_groups(values, fetched, changed, started)
+        self.async_update_listeners()
+
+    @callback
+    def async_request_groups_refresh(self, groups: set[str]) -> None:
+        """Request a refresh of some groups, without waiting for it.
+
+        Requests made while a refresh is pending are merged into it, so each
+        group is fetched once for all of them. The refresh waits until no
+        request came for REQUEST_REFRESH_DELAY, or REQUEST_REFRESH_MAX_DELAY
+        after the first one: a burst of commands, like a scene, is confirmed
+        by a single refresh of the groups it touched.
+        """
+        groups = groups & self.groups
+        if not groups:
+            return
+        now = monotonic()
+        if not self._pending_groups:
+            self._pending_since = now
+        self._pending_last = now
+        self._pending_groups |= groups
+        if self._groups_refresh_task is None:
+            self._groups_refresh_task = self.hass.async_create_background_task(
+                self._async_refresh_pending_groups(), f"{DOMAIN} groups refresh"
+            )
+
+    async def _async_refresh_pending_groups(self) -> None:
+        """Refresh the pending groups until no more are requested."""
+        try:
+            while self._pending_groups:
+                while (delay := self._pending_delay()) > 0:
+                    await asyncio.sleep(delay)
+                groups, self._pending_groups = self._pending_groups, set()
+                await self.async_refresh_groups(groups)
+        finally:
+            self._groups_refresh_task = None
+
+    def _pending_delay(self) -> float:
+        """Return the time left before refreshing the pending groups."""
+        return (
+            min(
+                self._pending_last + REQUEST_REFRESH_DELAY,
+                self._pending_since + REQUEST_REFRESH_MAX_DELAY,
+            )
+            - monotonic()
+        )
+
+    async def async_shutdown(self) -> None:
+        """Cancel any refresh of groups."""
+        await super().async_shutdown()
+        self._pending_groups.clear()
+        if self._groups_refresh_task is not None:
+            self._groups_refresh_task.cancel()
+
+    async def async_request_refresh(self) -> None:
+        """Request a refresh of all the groups, not only the due ones."""
+        self._refresh_all = True
+        await super().async_request_refresh()
+
+    async def _async_update_data(self) -> IpxSnapshot:
+        """Fetch data of the groups due for polling from API."""
+        now = monotonic()
+        due_groups = self._due_groups(now)
+        self._refresh_all = False
+        try:
+            # While the IPX800 is unreachable, polls fail at once and it is
+            # only probed from time to time, polling again once it answers
+            if self.ipx.breaker.probe_due():
+                await self.ipx.async_probe()
+            else:
+                # Fail even if no group is due, the data is not up to date
+                self.ipx.breaker.check()
+            values, fetched, changed = await self._async_fetch_groups(due_groups)
+        except Ipx800InvalidAuthError as err:
+            self._adapt_scan_interval(failed=True)
+            raise UpdateFailed("Authentication error on IPX800") from err
+        except (Ipx800CannotConnectError, Ipx800RequestError) as err:
+            self._adapt_scan_interval(failed=True)
+            raise UpdateFailed(f"Failed to communicating with API: {err}") from err
+
+        if fetched:
+            # Nothing was requested to measure otherwise
+            self._adapt_scan_interval(failed=False)
+        self.stale = False
+        return self._merge_groups(values, fetched, changed, now)
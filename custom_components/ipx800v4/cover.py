@@ -2,9 +2,8 @@
 
 import logging
 from typing import Any
-import asyncio
 
-from pypx800 import IPX800, X4VR, Ipx800RequestError
+from pypx800 import IPX800, X4VR, Ipx800CannotConnectError, Ipx800RequestError
 
 from homeassistant.components.cover import (
     ATTR_POSITION,
@@ -19,18 +18,28 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
     CONF_DEVICES,
+    CONF_TRAVEL_TIME,
     CONF_TYPE,
     CONTROLLER,
     COORDINATOR,
+    COVER_TILT_TIME,
+    DEFAULT_TRAVEL_TIME,
     DOMAIN,
     GLOBAL_PARALLEL_UPDATES,
     TYPE_X4VR_BSO,
 )
 from .entity import IpxEntity
+from .motion import IpxCoverTracker
+from .snapshot import Slot, in_range
 
 _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = GLOBAL_PARALLEL_UPDATES
 
+# Positions reported by the X4VR
+X4VR_OPEN = 0
+X4VR_CLOSED = 100
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -41,12 +50,16 @@ async def async_setup_entry(
     coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
     devices = hass.data[DOMAIN][entry.entry_id][CONF_DEVICES]["cover"]
 
+    # One tracker for all the covers of the gateway
+    tracker = IpxCoverTracker(hass, entry, coordinator)
     entities: list[CoverEntity] = []
 
     for device in devices:
-        entities.append(X4VRCover(device, controller, coordinator))  # noqa: PERF401
+        entities.append(  # noqa: PERF401
+            X4VRCover(device, controller, coordinator, tracker)
+        )
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 class X4VRCover(IpxEntity, CoverEntity):
@@ -57,10 +70,13 @@ class X4VRCover(IpxEntity, CoverEntity):
         device_config: dict,
         ipx: IPX800,
         coordinator: DataUpdateCoordinator,
+        tracker: IpxCoverTracker,
     ) -> None:
         """Initialize the X4VRCover."""
         super().__init__(device_config, ipx, coordinator)
         self.control = X4VR(ipx, self._ext_id, self._id)
+        self._tracker = tracker
+        self._travel_time = device_config.get(CONF_TRAVEL_TIME, DEFAULT_TRAVEL_TIME)
         self._attr_device_class = CoverDeviceClass.SHUTTER
         self._attr_supported_features = (
             CoverEntityFeature.OPEN
@@ -73,51 +89,85 @@ class X4VRCover(IpxEntity, CoverEntity):
                 CoverEntityFeature.CLOSE_TILT | CoverEntityFeature.OPEN_TILT
             )
 
-    @property
-    def available(self) -> bool:
-        """Return True if the cover level is present in the last update."""
-        return self._data_available(f"VR{self._ext_id}-{self._id}")
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"VR{self._ext_id}-{self._id}",)
+
+    def _push_values(self, state: str) -> dict[Slot, Any] | None:
+        """Convert a pushed cover position to snapshot values."""
+        try:
+            value = X4VR_CLOSED - int(float(state))
+        except (OverflowError, ValueError):
+            return None
+        # A position outside 0..100 is not a position of the cover
+        return {self._slot(): value} if in_range(self._slot(), value) else None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop tracking the cover motion."""
+        await super().async_will_remove_from_hass()
+        if self._data_slots:
+            self._tracker.async_untrack(self._slot(), notify=False)
 
     @property
     def is_closed(self) -> bool:
         """Return the state."""
-        return int(self.coordinator.data[f"VR{self._ext_id}-{self._id}"]) == 100
+        return self._value() == X4VR_CLOSED
+
+    @property
+    def is_opening(self) -> bool:
+        """Return if the cover is opening."""
+        return self._tracker.direction(self._slot()) < 0
+
+    @property
+    def is_closing(self) -> bool:
+        """Return if the cover is closing."""
+        return self._tracker.direction(self._slot()) > 0
 
     @property
     def current_cover_position(self) -> int:
-        """Return the current cover position."""
-        return 100 - int(self.coordinator.data[f"VR{self._ext_id}-{self._id}"])
+        """Return the current cover position, estimated while moving."""
+        position = self._tracker.estimate(self._slot())
+        if position is None:
+            position = self._value()
+        return 100 - position
+
+    def _async_track(self, target: int | None, travel_time: float) -> None:
+        """Track the cover motion until it reaches the target or stops."""
+        self._tracker.async_track(
+            self._slot(), target, travel_time, self.async_write_ha_state
+        )
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open cover."""
         try:
             await self.control.on()
-            asyncio.create_task(self.async_refresh_cover_state(20))
-        except Ipx800RequestError:
+            self._async_track(X4VR_OPEN, self._travel_time)
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error("An error occurred while open IPX800 cover: %s", self.name)
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         """Close cover."""
         try:
             await self.control.off()
-            asyncio.create_task(self.async_refresh_cover_state(20))
-        except Ipx800RequestError:
+            self._async_track(X4VR_CLOSED, self._travel_time)
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error("An error occurred while close IPX800 cover: %s", self.name)
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the cover."""
         try:
             await self.control.stop()
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._tracker.async_untrack(self._slot())
+            self._async_commanded()
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error("An error occurred while stop IPX800 cover: %s", self.name)
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         """Set the cover to a specific position."""
         try:
             await self.control.set_level(kwargs[ATTR_POSITION])
-            asyncio.create_task(self.async_refresh_cover_state(20))
-        except Ipx800RequestError:
+            self._async_track(100 - kwargs[ATTR_POSITION], self._travel_time)
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while set IPX800 cover position: %s", self.name
             )
@@ -126,8 +176,8 @@ class X4VRCover(IpxEntity, CoverEntity):
         """Open the cover tilt."""
         try:
             await self.control.set_pulse_up(1)
-            asyncio.create_task(self.async_refresh_cover_state(3))
-        except Ipx800RequestError:
+            self._async_track(None, COVER_TILT_TIME)
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while set IPX800 tilt position: %s", self.name
             )
@@ -136,23 +186,8 @@ class X4VRCover(IpxEntity, CoverEntity):
         """Close the cover tilt."""
         try:
             await self.control.set_pulse_down(1)
-            asyncio.create_task(self.async_refresh_cover_state(3))
-        except Ipx800RequestError:
+            self._async_track(None, COVER_TILT_TIME)
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while set IPX800 cover position: %s", self.name
             )
-
-    async def async_refresh_cover_state(self,repeat: int = 20) -> None:
-        """Refresh state during the cover operation."""
-        if repeat > 20:
-            repeat = 20
-        if repeat < 1:
-            repeat = 1
-        for i in range(repeat):
-            try:
-                await self.coordinator.async_request_refresh()
-            except Exception as e:
-                _LOGGER.error(
-                    "An error occurred while refreshing the cover state: %s", str(e)
-                )
-            await asyncio.sleep(2)
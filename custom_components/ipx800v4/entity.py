@@ -1,6 +1,7 @@
 """Generic IPX800V4 entity."""
 
-from pypx800 import IPX800
+import logging
+from typing import Any
 
 from homeassistant.const import (
     CONF_DEVICE_CLASS,
@@ -8,10 +9,8 @@ from homeassistant.const import (
     CONF_NAME,
     CONF_UNIT_OF_MEASUREMENT,
 )
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import slugify
 
 from .const import (
@@ -38,16 +37,21 @@ from .const import (
     TYPE_XPWM_RGBW,
     TYPE_XTHL,
 )
+from .coordinator import IpxDataUpdateCoordinator
+from .gateway import IpxGateway
+from .snapshot import COLUMNS, PUSH_ON_STATES, Slot, slot_for_key
+
+_LOGGER = logging.getLogger(__name__)
 
 
-class IpxEntity(CoordinatorEntity):
+class IpxEntity(CoordinatorEntity[IpxDataUpdateCoordinator]):
     """Representation of a IPX800 generic device entity."""
 
     def __init__(
         self,
         device_config: dict,
-        ipx: IPX800,
-        coordinator: DataUpdateCoordinator,
+        ipx: IpxGateway,
+        coordinator: IpxDataUpdateCoordinator,
         suffix_name: str = "",
     ) -> None:
         """Initialize the device."""
@@ -117,14 +121,99 @@ class IpxEntity(CoordinatorEntity):
             "configuration_url": configuration_url,
         }
 
-    def _data_available(self, *keys: str) -> bool:
-        """Return True if the last update succeeded and contains all keys.
+        # Only be notified by the coordinator when one of these slots changes
+        self._data_slots = self._get_data_slots()
+        self.coordinator_context = self._data_slots
 
-        Extension data (X4VR, X4FP, X-THL, X-PWM, X-Dimmer...) can be
-        transiently absent from the IPX800 global response. In that case the
-        entity is marked unavailable for the cycle instead of raising a
-        KeyError when its state is computed.
+    async def async_added_to_hass(self) -> None:
+        """Register the entity as a target of the IPX800 pushes."""
+        await super().async_added_to_hass()
+        entity_id = self.entity_id
+        self.coordinator.push_entities[entity_id] = self
+        self.async_on_remove(
+            lambda: self.coordinator.push_entities.pop(entity_id, None)
+        )
+
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return ()
+
+    @callback
+    def _async_commanded(self, updates: dict[Slot, Any] | None = None) -> None:
+        """Show the expected values of a command and refetch their groups.
+
+        The refresh only fetches the groups read by the entity, and is shared
+        with the commands sent at the same time.
         """
-        return self.coordinator.last_update_success and all(
-            key in self.coordinator.data for key in keys
+        if updates:
+            self.coordinator.async_set_shadow(updates)
+        self.coordinator.async_request_groups_refresh(
+            {COLUMNS[column][0] for column, _ in self._data_slots or ()}
         )
+
+    def push_values(self, state: str) -> dict[Slot, Any] | None:
+        """Return the snapshot values of a pushed state, None if unsupported."""
+        if not self._data_slots:
+            return None
+        return self._push_values(state)
+
+    def _push_values(self, state: str) -> dict[Slot, Any] | None:
+        """Convert a pushed state to snapshot values, None if unsupported."""
+        return None
+
+    def _push_on_off(self, state: str, invert: bool = False) -> dict[Slot, Any]:
+        """Return the value of an on/off pushed state."""
+        is_on = state.lower() in PUSH_ON_STATES
+        return {self._slot(): int(is_on != invert)}
+
+    def _push_number(self, state: str) -> dict[Slot, Any] | None:
+        """Return the value of a numeric pushed state, None if invalid."""
+        try:
+            return {self._slot(): float(state)}
+        except ValueError:
+            return None
+
+    def _get_data_slots(self) -> tuple[Slot, ...] | None:
+        """Return the snapshot slots of the data keys, None if one is invalid."""
+        slots = []
+        for key in self._get_data_keys():
+            if (slot := slot_for_key(key)) is None:
+                _LOGGER.error("Invalid id for %s, no value for %s", self.name, key)
+                return None
+            slots.append(slot)
+        return tuple(slots)
+
+    @property
+    def available(self) -> bool:
+        """Return True if the last update succeeded and contains all slots.
+
+        Extension data (X4VR, X4FP, X-THL, X-PWM, X-Dimmer...) can be
+        transiently absent from the IPX800 response. In that case the
+        entity is marked unavailable for the cycle instead of raising an
+        error when its state is computed.
+        """
+        if not self.coordinator.last_update_success or self._data_slots is None:
+            return False
+        present = self.coordinator.data.present
+        for column, cell in self._data_slots:
+            mask = present[column]
+            if cell >= len(mask) or not mask[cell]:
+                return False
+        return True
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag the state restored at startup until the IPX800 is polled."""
+        if self.coordinator.stale:
+            return {"stale": True}
+        return None
+
+    def _slot(self, index: int = 0, offset: int = 0) -> Slot:
+        """Return a snapshot slot of the entity."""
+        column, cell = self._data_slots[index]  # type: ignore[index]
+        return column, cell + offset
+
+    def _value(self, index: int = 0, offset: int = 0) -> Any:
+        """Return the value of a slot of the entity from the snapshot."""
+        column, cell = self._slot(index, offset)
+        return self.coordinator.data.values[column][cell]
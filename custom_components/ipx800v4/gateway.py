@@ -0,0 +1,444 @@
+"""Request scheduling and command batching for the GCE IPX800 V4."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import heapq
+from http import HTTPStatus
+from itertools import count
+import json
+import logging
+from time import monotonic
+
+import aiohttp
+from pypx800 import (
+    IPX800,
+    Ipx800CannotConnectError,
+    Ipx800InvalidAuthError,
+    Ipx800RequestError,
+)
+
+from .const import (
+    CIRCUIT_BACKOFF_MAX,
+    CIRCUIT_BACKOFF_MIN,
+    CIRCUIT_FAILURE_THRESHOLD,
+    COMMAND_BATCH_DELAY,
+    DEFAULT_MAX_REQUESTS,
+    DNS_CACHE_TTL,
+    KEEPALIVE_TIMEOUT,
+    LATENCY_SMOOTHING,
+)
+from .m2m import IpxM2MConnection
+
+_LOGGER = logging.getLogger(__name__)
+
+# Lower value is served first
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+
+# Command parameters taking a comma separated list of ids
+BATCH_LIST_PARAMS = {
+    "SetR",
+    "ClearR",
+    "ToggleR",
+    "SetVO",
+    "ClearVO",
+    "ToggleVO",
+    "SetVI",
+    "ClearVI",
+    "ToggleVI",
+}
+
+# Request checking if an unreachable IPX800 is back, one of the smallest
+PROBE_PARAMS = {"Get": "R"}
+
+
+def create_gateway_session(
+    max_connections: int, request_timeout: float
+) -> aiohttp.ClientSession:
+    """Return a HTTP session dedicated to a gateway.
+
+    The embedded web server of the IPX800 handles very few connections:
+    they are kept alive and bounded, and the host name is resolved once.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=max_connections,
+        limit_per_host=max_connections,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ssl=False,
+    )
+    return aiohttp.ClientSession(
+        connector=connector, timeout=aiohttp.ClientTimeout(total=request_timeout)
+    )
+
+
+def parse_api_response(body: bytes) -> dict:
+    """Decode a raw response of the IPX800 JSON API."""
+    try:
+        content = json.loads(body)
+    except ValueError as err:
+        raise Ipx800RequestError("Invalid response from the IPX800") from err
+    if content.get("status", "Success") != "Success":
+        raise Ipx800RequestError(f"Request failed: {content}")
+    return content
+
+
+class IpxRequestScheduler:
+    """Bound the concurrent requests sent to an IPX800.
+
+    Waiting requests are served by priority then arrival order, so a user
+    command never waits behind the polls queued before it.
+    """
+
+    def __init__(self, max_requests: int = DEFAULT_MAX_REQUESTS) -> None:
+        """Initialize the scheduler."""
+        self._max_requests = max_requests
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._order = count()
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[None]:
+        """Hold a request slot."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        """Wait for a free request slot."""
+        if self._active < self._max_requests and not self._waiters:
+            self._active += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        waiter = (priority, next(self._order), future)
+        heapq.heappush(self._waiters, waiter)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over right before the cancellation
+                self._release()
+            elif waiter in self._waiters:
+                # Otherwise _release already dropped the cancelled waiter
+                self._waiters.remove(waiter)
+                heapq.heapify(self._waiters)
+            raise
+
+    def _release(self) -> None:
+        """Hand the slot over to the next waiter or free it."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
+
+
+class IpxCircuitBreaker:
+    """Fail the requests at once while an IPX800 is unreachable.
+
+    After CIRCUIT_FAILURE_THRESHOLD consecutive connection failures, the
+    circuit opens: requests fail without being sent, and only a probe may
+    be sent, after a backoff doubling up to CIRCUIT_BACKOFF_MAX seconds.
+    The first successful request closes it.
+    """
+
+    def __init__(self, host: str) -> None:
+        """Initialize a closed circuit."""
+        self.host = host
+        self.failures = 0
+        self._backoff = 0.0
+        self._probe_at = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests fail at once."""
+        return self.failures >= CIRCUIT_FAILURE_THRESHOLD
+
+    def check(self) -> None:
+        """Raise if the circuit is open."""
+        if self.is_open:
+            raise Ipx800CannotConnectError(f"IPX800 {self.host} is unreachable")
+
+    def probe_due(self) -> bool:
+        """Return True if the circuit is open and a probe can be sent."""
+        return self.is_open and monotonic() >= self._probe_at
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        if self.is_open:
+            _LOGGER.info("IPX800 %s is reachable again", self.host)
+        self.failures = 0
+        self._backoff = 0.0
+
+    def record_failure(self) -> None:
+        """Count a connection failure, open the circuit on too many."""
+        self.failures += 1
+        if not self.is_open:
+            return
+        if self.failures == CIRCUIT_FAILURE_THRESHOLD:
+            _LOGGER.warning(
+                "IPX800 %s is unreachable, requests fail until it answers again",
+                self.host,
+            )
+        self._backoff = min(
+            max(self._backoff * 2, CIRCUIT_BACKOFF_MIN), CIRCUIT_BACKOFF_MAX
+        )
+        self._probe_at = monotonic() + self._backoff
+
+
+class IpxCommandBatch:
+    """Commands merged into a single IPX800 API request."""
+
+    def __init__(self) -> None:
+        """Initialize an empty batch."""
+        self.params: dict = {}
+        self.futures: list[asyncio.Future[dict]] = []
+        # List parameter of the merged commands, None for a command sent alone
+        self.action: str | None = None
+
+    def add(self, params: dict, future: asyncio.Future[dict]) -> bool:
+        """Merge the command parameters, return False if they cannot be.
+
+        Only commands of the same action on a list parameter are merged,
+        their ids joined (SetR=1,2,3): the IPX800 runs one action and reports
+        one status for the request. Any other command (ClearR after SetR,
+        SetVR01, SetG03 with Time, SetC01, pulses...) starts a new request,
+        as does an id already in the batch, like a second toggle, to keep
+        the commands order.
+        """
+        action = next(iter(params)) if len(params) == 1 else None
+        if action not in BATCH_LIST_PARAMS:
+            action = None
+        if self.futures and (
+            action is None
+            or action != self.action
+            or str(params[action]) in self.params[action]
+        ):
+            return False
+
+        if action is None:
+            self.params = dict(params)
+        else:
+            self.params.setdefault(action, []).append(str(params[action]))
+        self.action = action
+        self.futures.append(future)
+        return True
+
+    def set_result(self, result: dict) -> None:
+        """Resolve the commands with the request result."""
+        for future in self.futures:
+            if not future.done():
+                future.set_result(result)
+
+    def set_exception(self, err: Exception) -> None:
+        """Resolve the commands with the request error."""
+        for future in self.futures:
+            if not future.done():
+                future.set_exception(err)
+
+    def cancel(self) -> None:
+        """Cancel the commands waiting for the request."""
+        for future in self.futures:
+            future.cancel()
+
+    def query(self) -> dict:
+        """Return the parameters of the request."""
+        return {
+            key: ",".join(value) if key == self.action else value
+            for key, value in self.params.items()
+        }
+
+
+class IpxGateway(IPX800):
+    """IPX800 API client sending all requests of a gateway through a scheduler.
+
+    Entities control objects (Relay, XPWM, X4VR...) use it as their IPX800,
+    so their commands share the scheduler with the coordinator polls. JSON
+    API commands issued within COMMAND_BATCH_DELAY are sent in as few
+    requests as possible, each caller getting the result of its request:
+    only relay and virtual IO commands of the same action are merged.
+    With an M2M connection, JSON API requests use it instead of HTTP.
+
+    While the IPX800 is unreachable, a circuit breaker fails the requests
+    at once instead of letting each of them wait for its timeout.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_requests: int = DEFAULT_MAX_REQUESTS,
+        m2m: IpxM2MConnection | None = None,
+        **kwargs,
+    ) -> None:
+        """Initialize the gateway."""
+        super().__init__(**kwargs)
+        self.http_session: aiohttp.ClientSession = kwargs["session"]
+        self._api_url = f"http://{kwargs['host']}:{kwargs['port']}/api/xdevices.json"
+        self._api_key = kwargs["api_key"]
+        self._auth = (
+            aiohttp.BasicAuth(kwargs["username"], kwargs.get("password") or "")
+            if kwargs.get("username")
+            else None
+        )
+        self.scheduler = IpxRequestScheduler(max_requests)
+        self.breaker = IpxCircuitBreaker(kwargs["host"])
+        self.m2m = m2m
+        # Smoothed and last duration of the requests, in seconds
+        self.latency: float | None = None
+        self.last_latency: float | None = None
+        self._batches: list[IpxCommandBatch] = []
+        self._flush_task: asyncio.Task | None = None
+
+    async def request_api(self, params: dict, priority: int = PRIORITY_COMMAND) -> dict:
+        """Make a request to the IPX800 JSON API once a slot is free."""
+        self.breaker.check()
+        if priority == PRIORITY_COMMAND and "Get" not in params:
+            return await self._async_queue_command(params)
+        async with self.scheduler.slot(priority):
+            return await self._async_send_api(params)
+
+    async def request_api_raw(
+        self, params: dict, priority: int = PRIORITY_POLL
+    ) -> bytes:
+        """Make a request to the IPX800 JSON API, return the raw response.
+
+        Decode it with parse_api_response.
+        """
+        self.breaker.check()
+        return await self._async_request_raw(params, priority)
+
+    async def async_probe(self) -> None:
+        """Send a small request to check if an unreachable IPX800 is back."""
+        await self._async_request_raw(PROBE_PARAMS, PRIORITY_POLL, probe=True)
+
+    async def _async_request_raw(
+        self, params: dict, priority: int, probe: bool = False
+    ) -> bytes:
+        """Make a request to the IPX800 JSON API once a slot is free."""
+        async with self.scheduler.slot(priority), self._measure(probe):
+            if self.m2m is not None:
+                return await self.m2m.request_raw(params)
+            try:
+                async with self.http_session.get(
+                    self._api_url,
+                    params={"key": self._api_key, **params},
+                    auth=self._auth,
+                ) as response:
+                    if response.status == HTTPStatus.UNAUTHORIZED:
+                        raise Ipx800InvalidAuthError("Authentication failed")
+                    response.raise_for_status()
+                    return await response.read()
+            except aiohttp.ClientResponseError as err:
+                raise Ipx800RequestError(f"Request failed: {err}") from err
+            except (aiohttp.ClientError, TimeoutError) as err:
+                raise Ipx800CannotConnectError(f"Cannot connect: {err}") from err
+
+    async def _async_send_api(self, params: dict) -> dict:
+        """Send a JSON API request over M2M if enabled, HTTP otherwise."""
+        async with self._measure():
+            if self.m2m is not None:
+                return parse_api_response(await self.m2m.request_raw(params))
+            return await super().request_api(params)
+
+    @asynccontextmanager
+    async def _measure(self, probe: bool = False) -> AsyncIterator[None]:
+        """Measure the duration of a successful request.
+
+        Also feed the circuit breaker, a request waiting for its slot while
+        the circuit opened fails at once unless it is the probe.
+        """
+        if not probe:
+            self.breaker.check()
+        start = monotonic()
+        try:
+            yield
+        except Ipx800CannotConnectError:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        self.last_latency = monotonic() - start
+        if self.latency is None:
+            self.latency = self.last_latency
+        else:
+            self.latency += LATENCY_SMOOTHING * (self.last_latency - self.latency)
+        _LOGGER.debug(
+            "Request to %s took %.3fs (average %.3fs)",
+            self.host,
+            self.last_latency,
+            self.latency,
+        )
+
+    async def async_close(self) -> None:
+        """Cancel the pending commands and close the M2M connection, if any."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        if self.m2m is not None:
+            await self.m2m.async_close()
+
+    async def request_cgi(self, params: dict, priority: int = PRIORITY_COMMAND) -> dict:
+        """Make a request to the IPX800 CGI API once a slot is free."""
+        self.breaker.check()
+        async with self.scheduler.slot(priority), self._measure():
+            return await super().request_cgi(params)
+
+    async def set_pwm_levels(self, levels: dict[int, int], time: float) -> None:
+        """Set the level of several X-PWM channels in one ordered burst.
+
+        Channels set to the same level share a single CGI request
+        (SetPWM=1,2,3), and the requests are sent one after the other in the
+        same slot so no other request is interleaved with a color change.
+        """
+        channels_by_level: dict[int, list[str]] = {}
+        for channel, level in levels.items():
+            channels_by_level.setdefault(level, []).append(str(channel))
+        self.breaker.check()
+        async with self.scheduler.slot(PRIORITY_COMMAND):
+            for level, channels in channels_by_level.items():
+                async with self._measure():
+                    await super().request_cgi(
+                        {
+                            "SetPWM": ",".join(channels),
+                            "PWMValue": level,
+                            "PWMDelay": time,
+                        }
+                    )
+
+    async def _async_queue_command(self, params: dict) -> dict:
+        """Add a command to the pending batches and wait for its result."""
+        future: asyncio.Future[dict] = asyncio.get_running_loop().create_future()
+        if not self._batches or not self._batches[-1].add(params, future):
+            batch = IpxCommandBatch()
+            batch.add(params, future)
+            self._batches.append(batch)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._async_flush_commands())
+        return await future
+
+    async def _async_flush_commands(self) -> None:
+        """Send the pending batches in order, once the batch window is over."""
+        try:
+            await asyncio.sleep(COMMAND_BATCH_DELAY)
+            while self._batches:
+                # Sealed: commands queued while it is sent start a new batch
+                batch = self._batches.pop(0)
+                try:
+                    async with self.scheduler.slot(PRIORITY_COMMAND):
+                        result = await self._async_send_api(batch.query())
+                except asyncio.CancelledError:
+                    batch.cancel()
+                    raise
+                except Exception as err:  # noqa: BLE001
+                    batch.set_exception(err)
+                else:
+                    batch.set_result(result)
+        finally:
+            # Only left on cancellation, callers must not wait forever
+            for batch in self._batches:
+                batch.cancel()
+            self._batches.clear()
+            self._flush_task = None
@@ -1,10 +1,16 @@
 """Support for IPX800 V4 lights."""
 
-from asyncio import gather as async_gather
 import logging
 from typing import Any
 
-from pypx800 import IPX800, XPWM, Ipx800RequestError, Relay, XDimmer
+from pypx800 import (
+    IPX800,
+    XPWM,
+    Ipx800CannotConnectError,
+    Ipx800RequestError,
+    Relay,
+    XDimmer,
+)
 
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
@@ -37,6 +43,7 @@ from .const import (
     TYPE_XPWM_RGBW,
 )
 from .entity import IpxEntity
+from .snapshot import XDIMMER_LEVEL, XDIMMER_STATE, Slot, in_range
 
 _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = GLOBAL_PARALLEL_UPDATES
@@ -76,7 +83,7 @@ async def async_setup_entry(
         elif device.get(CONF_TYPE) == TYPE_XPWM_RGBW:
             entities.append(XPWMRGBWLight(device, controller, coordinator))
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 class RelayLight(IpxEntity, LightEntity):
@@ -94,22 +101,25 @@ class RelayLight(IpxEntity, LightEntity):
         self._attr_supported_color_modes = {ColorMode.ONOFF}
         self._attr_color_mode = ColorMode.ONOFF
 
-    @property
-    def available(self) -> bool:
-        """Return True if the relay state is present in the last update."""
-        return self._data_available(f"R{self._id}")
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"R{self._id}",)
+
+    def _push_values(self, state: str) -> dict[Slot, Any] | None:
+        """Convert a pushed state to snapshot values."""
+        return self._push_on_off(state)
 
     @property
     def is_on(self) -> bool:
         """Return if the light is on."""
-        return self.coordinator.data[f"R{self._id}"] == 1
+        return self._value() == 1
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light."""
         try:
             await self.control.on()
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._async_commanded({self._slot(): 1})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while turning on IPX800 light: %s", self.name
             )
@@ -119,8 +129,8 @@ class RelayLight(IpxEntity, LightEntity):
         """Turn off the light."""
         try:
             await self.control.off()
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._async_commanded({self._slot(): 0})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while turning off IPX800 light: %s", self.name
             )
@@ -129,9 +139,10 @@ class RelayLight(IpxEntity, LightEntity):
     async def async_toggle(self, **kwargs: Any) -> None:
         """Toggle the light."""
         try:
+            is_on = self.is_on
             await self.control.toggle()
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._async_commanded({self._slot(): int(not is_on)})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error("An error occurred while toggle IPX800 light: %s", self.name)
             return
 
@@ -153,20 +164,19 @@ class XDimmerLight(IpxEntity, LightEntity):
         self._attr_color_mode = ColorMode.BRIGHTNESS
         self._attr_supported_features = LightEntityFeature.TRANSITION
 
-    @property
-    def available(self) -> bool:
-        """Return True if the dimmer data is present in the last update."""
-        return self._data_available(f"G{self._id}")
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"G{self._id}",)
 
     @property
     def is_on(self) -> bool:
         """Return if the light is on."""
-        return self.coordinator.data[f"G{self._id}"]["Etat"] == "ON"
+        return self._value(offset=XDIMMER_STATE) == 1
 
     @property
     def brightness(self) -> int:
         """Return the brightness of the light."""
-        return scaleto255(self.coordinator.data[f"G{self._id}"]["Valeur"])
+        return scaleto255(self._value(offset=XDIMMER_LEVEL))
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light."""
@@ -174,13 +184,18 @@ class XDimmerLight(IpxEntity, LightEntity):
             if ATTR_TRANSITION in kwargs:
                 self._transition = kwargs[ATTR_TRANSITION]
             if ATTR_BRIGHTNESS in kwargs:
-                await self.control.set_level(
-                    scaleto100(kwargs[ATTR_BRIGHTNESS]), self._transition * 1000
+                level = scaleto100(kwargs[ATTR_BRIGHTNESS])
+                await self.control.set_level(level, self._transition * 1000)
+                self._async_commanded(
+                    {
+                        self._slot(offset=XDIMMER_STATE): int(level > 0),
+                        self._slot(offset=XDIMMER_LEVEL): level,
+                    }
                 )
             else:
                 await self.control.on(self._transition * 1000)
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+                self._async_commanded({self._slot(offset=XDIMMER_STATE): 1})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while turning on IPX800 light: %s", self.name
             )
@@ -191,8 +206,8 @@ class XDimmerLight(IpxEntity, LightEntity):
             if ATTR_TRANSITION in kwargs:
                 self._transition = kwargs[ATTR_TRANSITION]
             await self.control.off(self._transition * 1000)
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._async_commanded({self._slot(offset=XDIMMER_STATE): 0})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while turning off IPX800 light: %s", self.name
             )
@@ -202,9 +217,10 @@ class XDimmerLight(IpxEntity, LightEntity):
         try:
             if ATTR_TRANSITION in kwargs:
                 self._transition = kwargs[ATTR_TRANSITION]
+            is_on = self.is_on
             await self.control.toggle(self._transition * 1000)
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._async_commanded({self._slot(offset=XDIMMER_STATE): int(not is_on)})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error("An error occurred while toggle IPX800 light: %s", self.name)
 
 
@@ -229,20 +245,27 @@ class XPWMLight(IpxEntity, LightEntity):
         self._attr_color_mode = ColorMode.BRIGHTNESS
         self._attr_supported_features = LightEntityFeature.TRANSITION
 
-    @property
-    def available(self) -> bool:
-        """Return True if the PWM channel is present in the last update."""
-        return self._data_available(f"PWM{self._id}")
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"PWM{self._id}",)
+
+    def _push_values(self, state: str) -> dict[Slot, Any] | None:
+        """Convert a pushed level to snapshot values."""
+        try:
+            value = round(float(state))
+        except (OverflowError, ValueError):
+            return None
+        return {self._slot(): value} if in_range(self._slot(), value) else None
 
     @property
     def is_on(self) -> bool:
         """Return if the light is on."""
-        return self.coordinator.data[f"PWM{self._id}"] > 0
+        return self._value() > 0
 
     @property
     def brightness(self) -> int:
         """Return the brightness of the light."""
-        return scaleto255(self.coordinator.data[f"PWM{self._id}"])
+        return scaleto255(self._value())
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light."""
@@ -250,15 +273,12 @@ class XPWMLight(IpxEntity, LightEntity):
             if ATTR_TRANSITION in kwargs:
                 self._transition = kwargs[ATTR_TRANSITION]
             if ATTR_BRIGHTNESS in kwargs:
-                await self.control.set_level(
-                    scaleto100(kwargs[ATTR_BRIGHTNESS]), self._transition * 1000
-                )
+                level = scaleto100(kwargs[ATTR_BRIGHTNESS])
             else:
-                await self.control.set_level(
-                    self._default_brightness, self._transition * 1000
-                )
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+                level = self._default_brightness
+            await self.control.set_level(level, self._transition * 1000)
+            self._async_commanded({self._slot(): level})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while turning on IPX800 light: %s", self.name
             )
@@ -269,8 +289,8 @@ class XPWMLight(IpxEntity, LightEntity):
             if ATTR_TRANSITION in kwargs:
                 self._transition = kwargs[ATTR_TRANSITION]
             await self.control.off(self._transition * 1000)
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._async_commanded({self._slot(): 0})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while turning off IPX800 light: %s", self.name
             )
@@ -281,8 +301,9 @@ class XPWMLight(IpxEntity, LightEntity):
             if ATTR_TRANSITION in kwargs:
                 self._transition = kwargs[ATTR_TRANSITION]
             await self.control.toggle(self._transition * 1000)
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            # The level restored by the IPX800 is unknown, read it back
+            self._async_commanded()
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error("An error occurred while toggle IPX800 light: %s", self.name)
 
 
@@ -297,9 +318,6 @@ class XPWMRGBLight(IpxEntity, LightEntity):
     ) -> None:
         """Initialize the XPWMRGBLight."""
         super().__init__(device_config, ipx, coordinator)
-        self.xpwm_rgb_r = XPWM(ipx, self._ids[0])
-        self.xpwm_rgb_g = XPWM(ipx, self._ids[1])
-        self.xpwm_rgb_b = XPWM(ipx, self._ids[2])
 
         self._default_brightness = scaleto100(
             device_config.get(CONF_DEFAULT_BRIGHTNESS, 255)
@@ -309,12 +327,9 @@ class XPWMRGBLight(IpxEntity, LightEntity):
         self._attr_color_mode = ColorMode.RGB
         self._attr_supported_features = LightEntityFeature.TRANSITION
 
-    @property
-    def available(self) -> bool:
-        """Return True if all PWM channels are present in the last update."""
-        return self._data_available(
-            f"PWM{self._ids[0]}", f"PWM{self._ids[1]}", f"PWM{self._ids[2]}"
-        )
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"PWM{self._ids[0]}", f"PWM{self._ids[1]}", f"PWM{self._ids[2]}")
 
     @property
     def is_on(self) -> bool:
@@ -329,9 +344,9 @@ class XPWMRGBLight(IpxEntity, LightEntity):
     @property
     def rgb_color(self) -> tuple[int, int, int]:
         """Return the RGB color from RGB levels."""
-        level_r = scaleto255(self.coordinator.data[f"PWM{self._ids[0]}"])
-        level_g = scaleto255(self.coordinator.data[f"PWM{self._ids[1]}"])
-        level_b = scaleto255(self.coordinator.data[f"PWM{self._ids[2]}"])
+        level_r = scaleto255(self._value(0))
+        level_g = scaleto255(self._value(1))
+        level_b = scaleto255(self._value(2))
         return (level_r, level_g, level_b)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -340,73 +355,26 @@ class XPWMRGBLight(IpxEntity, LightEntity):
             if ATTR_TRANSITION in kwargs:
                 self._transition = kwargs[ATTR_TRANSITION]
             if ATTR_RGB_COLOR in kwargs:
-                colors = kwargs[ATTR_RGB_COLOR]
-                await async_gather(
-                    self.xpwm_rgb_r.set_level(
-                        scaleto100(colors[0]), self._transition * 1000
-                    ),
-                    self.xpwm_rgb_g.set_level(
-                        scaleto100(colors[1]), self._transition * 1000
-                    ),
-                    self.xpwm_rgb_b.set_level(
-                        scaleto100(colors[2]), self._transition * 1000
-                    ),
-                )
+                levels = [scaleto100(color) for color in kwargs[ATTR_RGB_COLOR]]
             elif ATTR_BRIGHTNESS in kwargs:
                 brightness = kwargs[ATTR_BRIGHTNESS]
                 if self.is_on:
-                    await async_gather(
-                        self.xpwm_rgb_r.set_level(
-                            scaleto100(
-                                self.rgb_color[0] * brightness / self.brightness
-                            ),
-                            self._transition * 1000,
-                        ),
-                        self.xpwm_rgb_g.set_level(
-                            scaleto100(
-                                self.rgb_color[1] * brightness / self.brightness
-                            ),
-                            self._transition * 1000,
-                        ),
-                        self.xpwm_rgb_b.set_level(
-                            scaleto100(
-                                self.rgb_color[2] * brightness / self.brightness
-                            ),
-                            self._transition * 1000,
-                        ),
-                    )
+                    levels = [
+                        scaleto100(color * brightness / self.brightness)
+                        for color in self.rgb_color
+                    ]
                 else:
-                    await async_gather(
-                        self.xpwm_rgb_r.set_level(
-                            scaleto100(brightness),
-                            self._transition * 1000,
-                        ),
-                        self.xpwm_rgb_g.set_level(
-                            scaleto100(brightness),
-                            self._transition * 1000,
-                        ),
-                        self.xpwm_rgb_b.set_level(
-                            scaleto100(brightness),
-                            self._transition * 1000,
-                        ),
-                    )
+                    levels = [scaleto100(brightness)] * 3
             else:
-                await async_gather(
-                    self.xpwm_rgb_r.set_level(
-                        scaleto100(self._default_brightness),
-                        self._transition * 1000,
-                    ),
-                    self.xpwm_rgb_g.set_level(
-                        scaleto100(self._default_brightness),
-                        self._transition * 1000,
-                    ),
-                    self.xpwm_rgb_b.set_level(
-                        scaleto100(self._default_brightness),
-                        self._transition * 1000,
-                    ),
-                )
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+                levels = [scaleto100(self._default_brightness)] * 3
+            # All channels of the color change are sent at once
+            await self.ipx.set_pwm_levels(
+                dict(zip(self._ids, levels, strict=False)), self._transition * 1000
+            )
+            self._async_commanded(
+                {self._slot(index): level for index, level in enumerate(levels)}
+            )
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while turn off IPX800 light: %s", self.name
             )
@@ -416,13 +384,11 @@ class XPWMRGBLight(IpxEntity, LightEntity):
         try:
             if ATTR_TRANSITION in kwargs:
                 self._transition = kwargs[ATTR_TRANSITION]
-            await async_gather(
-                self.xpwm_rgb_r.off(self._transition * 1000),
-                self.xpwm_rgb_g.off(self._transition * 1000),
-                self.xpwm_rgb_b.off(self._transition * 1000),
+            await self.ipx.set_pwm_levels(
+                dict.fromkeys(self._ids[:3], 0), self._transition * 1000
             )
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._async_commanded({self._slot(index): 0 for index in range(3)})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while turn off IPX800 light: %s", self.name
             )
@@ -439,10 +405,6 @@ class XPWMRGBWLight(IpxEntity, LightEntity):
     ) -> None:
         """Initialize the XPWMRGBWLight."""
         super().__init__(device_config, ipx, coordinator)
-        self.xpwm_rgbw_r = XPWM(ipx, self._ids[0])
-        self.xpwm_rgbw_g = XPWM(ipx, self._ids[1])
-        self.xpwm_rgbw_b = XPWM(ipx, self._ids[2])
-        self.xpwm_rgbw_w = XPWM(ipx, self._ids[3])
 
         self._default_brightness = scaleto100(
             device_config.get(CONF_DEFAULT_BRIGHTNESS, 255)
@@ -452,10 +414,9 @@ class XPWMRGBWLight(IpxEntity, LightEntity):
         self._attr_color_mode = ColorMode.RGBW
         self._attr_supported_features = LightEntityFeature.TRANSITION
 
-    @property
-    def available(self) -> bool:
-        """Return True if all PWM channels are present in the last update."""
-        return self._data_available(
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (
             f"PWM{self._ids[0]}",
             f"PWM{self._ids[1]}",
             f"PWM{self._ids[2]}",
@@ -475,10 +436,10 @@ class XPWMRGBWLight(IpxEntity, LightEntity):
     @property
     def rgbw_color(self) -> tuple[int, int, int, int]:
         """Return the RGB color from RGB levels."""
-        level_r = scaleto255(self.coordinator.data[f"PWM{self._ids[0]}"])
-        level_g = scaleto255(self.coordinator.data[f"PWM{self._ids[1]}"])
-        level_b = scaleto255(self.coordinator.data[f"PWM{self._ids[2]}"])
-        level_w = scaleto255(self.coordinator.data[f"PWM{self._ids[3]}"])
+        level_r = scaleto255(self._value(0))
+        level_g = scaleto255(self._value(1))
+        level_b = scaleto255(self._value(2))
+        level_w = scaleto255(self._value(3))
         return (level_r, level_g, level_b, level_w)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -488,62 +449,34 @@ class XPWMRGBWLight(IpxEntity, LightEntity):
                 self._transition = kwargs[ATTR_TRANSITION]
 
             if ATTR_RGBW_COLOR in kwargs:
-                colors = kwargs[ATTR_RGBW_COLOR]
-                # if only rgb color have been set
-                await async_gather(
-                    self.xpwm_rgbw_r.set_level(
-                        scaleto100(colors[0]), self._transition * 1000
-                    ),
-                    self.xpwm_rgbw_g.set_level(
-                        scaleto100(colors[1]), self._transition * 1000
-                    ),
-                    self.xpwm_rgbw_b.set_level(
-                        scaleto100(colors[2]), self._transition * 1000
-                    ),
-                    self.xpwm_rgbw_w.set_level(
-                        scaleto100(colors[3]), self._transition * 1000
-                    ),
-                )
+                levels = {
+                    channel: scaleto100(color)
+                    for channel, color in zip(
+                        self._ids, kwargs[ATTR_RGBW_COLOR], strict=False
+                    )
+                }
             elif ATTR_BRIGHTNESS in kwargs:
                 brightness = kwargs[ATTR_BRIGHTNESS]
                 if self.is_on:
-                    await async_gather(
-                        self.xpwm_rgbw_r.set_level(
-                            scaleto100(
-                                self.rgbw_color[0] * brightness / self.brightness
-                            ),
-                            self._transition * 1000,
-                        ),
-                        self.xpwm_rgbw_g.set_level(
-                            scaleto100(
-                                self.rgbw_color[1] * brightness / self.brightness
-                            ),
-                            self._transition * 1000,
-                        ),
-                        self.xpwm_rgbw_b.set_level(
-                            scaleto100(
-                                self.rgbw_color[2] * brightness / self.brightness
-                            ),
-                            self._transition * 1000,
-                        ),
-                        self.xpwm_rgbw_w.set_level(
-                            scaleto100(
-                                self.rgbw_color[3] * brightness / self.brightness
-                            ),
-                            self._transition * 1000,
-                        ),
-                    )
+                    levels = {
+                        channel: scaleto100(color * brightness / self.brightness)
+                        for channel, color in zip(
+                            self._ids, self.rgbw_color, strict=False
+                        )
+                    }
                 else:
-                    await self.xpwm_rgbw_w.set_level(
-                        scaleto100(brightness),
-                        self._transition * 1000,
-                    )
+                    levels = {self._ids[3]: scaleto100(brightness)}
             else:
-                await self.xpwm_rgbw_w.set_level(
-                    self._default_brightness, self._transition * 1000
-                )
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+                levels = {self._ids[3]: self._default_brightness}
+            # All channels of the color change are sent at once
+            await self.ipx.set_pwm_levels(levels, self._transition * 1000)
+            self._async_commanded(
+                {
+                    self._slot(self._ids.index(channel)): level
+                    for channel, level in levels.items()
+                }
+            )
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while turn off IPX800 light: %s", self.name
             )
@@ -553,14 +486,11 @@ class XPWMRGBWLight(IpxEntity, LightEntity):
         try:
             if ATTR_TRANSITION in kwargs:
                 self._transition = kwargs[ATTR_TRANSITION]
-            await async_gather(
-                self.xpwm_rgbw_w.off(self._transition * 1000),
-                self.xpwm_rgbw_r.off(self._transition * 1000),
-                self.xpwm_rgbw_g.off(self._transition * 1000),
-                self.xpwm_rgbw_b.off(self._transition * 1000),
+            await self.ipx.set_pwm_levels(
+                dict.fromkeys(self._ids[:4], 0), self._transition * 1000
             )
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._async_commanded({self._slot(index): 0 for index in range(4)})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while turn off IPX800 light: %s", self.name
             )
@@ -0,0 +1,96 @@
+"""Persistent M2M (TCP) connection to the GCE IPX800 V4."""
+
+import asyncio
+import logging
+from time import monotonic
+from urllib.parse import urlencode
+
+from pypx800 import Ipx800CannotConnectError
+
+from .const import M2M_BACKOFF_MAX, M2M_BACKOFF_MIN, M2M_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IpxM2MConnection:
+    """A single TCP connection to the M2M interface of an IPX800.
+
+    Requests are the parameters of the JSON API sent as one line, the
+    IPX800 answers each of them with one line of JSON, in order. The
+    connection is opened on the first request and kept open; when it
+    fails, it is reopened after a backoff doubling up to M2M_BACKOFF_MAX
+    seconds, requests failing at once in the meantime.
+    """
+
+    def __init__(self, host: str, port: int, api_key: str) -> None:
+        """Initialize the connection."""
+        self.host = host
+        self.port = port
+        self._api_key = api_key
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+        self._backoff = 0.0
+        self._retry_at = 0.0
+
+    async def request_raw(self, params: dict) -> bytes:
+        """Send a JSON API request over the connection, return its raw answer."""
+        line = urlencode({"key": self._api_key, **params}) + "\r\n"
+        async with self._lock:
+            if self._writer is None and monotonic() < self._retry_at:
+                raise Ipx800CannotConnectError("Waiting before reconnecting")
+            try:
+                reader, writer = await self._async_connect()
+                writer.write(line.encode())
+                await writer.drain()
+                response = await asyncio.wait_for(reader.readline(), M2M_TIMEOUT)
+                if not response:
+                    raise ConnectionResetError("Connection closed by the IPX800")
+            except asyncio.CancelledError:
+                # The answer would be read as the one of the next request
+                self._disconnect()
+                raise
+            except (OSError, TimeoutError) as err:
+                self._disconnect()
+                self._backoff = min(
+                    max(self._backoff * 2, M2M_BACKOFF_MIN), M2M_BACKOFF_MAX
+                )
+                self._retry_at = monotonic() + self._backoff
+                _LOGGER.debug(
+                    "M2M connection to %s failed, retry in %ss: %s",
+                    self.host,
+                    self._backoff,
+                    err,
+                )
+                raise Ipx800CannotConnectError from err
+        self._backoff = 0.0
+        return response
+
+    async def _async_connect(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Return the open connection, opening it if needed."""
+        if self._reader is not None and self._writer is not None:
+            return self._reader, self._writer
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), M2M_TIMEOUT
+        )
+        _LOGGER.debug("M2M connection to %s:%s opened", self.host, self.port)
+        return self._reader, self._writer
+
+    def _disconnect(self) -> None:
+        """Close the connection, a new one is opened on the next request."""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    async def async_close(self) -> None:
+        """Close the connection."""
+        async with self._lock:
+            writer = self._writer
+            self._disconnect()
+            if writer is not None:
+                try:
+                    await writer.wait_closed()
+                except OSError:
+                    pass
@@ -0,0 +1,142 @@
+"""Motion tracking of the GCE IPX800 V4 covers."""
+
+import asyncio
+from dataclasses import dataclass
+import logging
+from time import monotonic
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import (
+    COVER_MOTION_GRACE,
+    COVER_MOTION_TIMEOUT,
+    COVER_POLL_INTERVAL,
+    DOMAIN,
+    GROUP_X4VR,
+)
+from .coordinator import IpxDataUpdateCoordinator
+from .snapshot import Slot
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class CoverMotion:
+    """A commanded motion of a cover, positions as reported by the X4VR."""
+
+    start: int
+    target: int | None
+    started: float
+    duration: float
+    update_callback: CALLBACK_TYPE
+    last_polled: int | None = None
+
+    def estimate(self, now: float) -> int | None:
+        """Return the position expected from the elapsed time."""
+        if self.target is None or self.duration <= 0:
+            return None
+        progress = min(1.0, (now - self.started) / self.duration)
+        return round(self.start + (self.target - self.start) * progress)
+
+    def is_over(self, polled: int | None, now: float) -> bool:
+        """Return True once the target is reached or the cover stopped.
+
+        The cover stopped if the X4VR reports the same position as on the
+        previous poll once the travel time is over.
+        """
+        elapsed = now - self.started
+        return (
+            polled == self.target
+            or (
+                elapsed >= self.duration + COVER_MOTION_GRACE
+                and polled == self.last_polled
+            )
+            or elapsed >= COVER_MOTION_TIMEOUT
+        )
+
+
+class IpxCoverTracker:
+    """Track the moving covers of a gateway with a single X4VR poll loop.
+
+    While at least one cover moves, only the X4VR group is fetched, every
+    COVER_POLL_INTERVAL seconds whatever the number of moving covers, unless
+    another refresh fetched it meanwhile. Until
+    the X4VR reports a new position, the position is estimated from the
+    travel time of the cover.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinator: IpxDataUpdateCoordinator,
+    ) -> None:
+        """Initialize the tracker."""
+        self._hass = hass
+        self._entry = entry
+        self._coordinator = coordinator
+        self._motions: dict[Slot, CoverMotion] = {}
+        self._task: asyncio.Task | None = None
+
+    @callback
+    def async_track(
+        self,
+        slot: Slot,
+        target: int | None,
+        travel_time: float,
+        update_callback: CALLBACK_TYPE,
+    ) -> None:
+        """Track a new motion of a cover, replacing its previous one."""
+        start = self._coordinator.data.get(slot, 0)
+        duration = (
+            travel_time if target is None else travel_time * abs(target - start) / 100
+        )
+        self._motions[slot] = CoverMotion(
+            start, target, monotonic(), duration, update_callback, start
+        )
+        if self._task is None:
+            self._task = self._entry.async_create_background_task(
+                self._hass, self._async_poll_motions(), f"{DOMAIN} cover motion"
+            )
+        update_callback()
+
+    @callback
+    def async_untrack(self, slot: Slot, notify: bool = True) -> None:
+        """Stop tracking a cover, notifying it unless it is being removed."""
+        if (motion := self._motions.pop(slot, None)) is not None and notify:
+            motion.update_callback()
+
+    def direction(self, slot: Slot) -> int:
+        """Return -1 if the cover opens, 1 if it closes, 0 otherwise."""
+        motion = self._motions.get(slot)
+        if motion is None or motion.target is None or motion.target == motion.start:
+            return 0
+        return 1 if motion.target > motion.start else -1
+
+    def estimate(self, slot: Slot) -> int | None:
+        """Return the estimated position of a cover the X4VR did not update."""
+        motion = self._motions.get(slot)
+        if motion is None or motion.last_polled != motion.start:
+            return None
+        return motion.estimate(monotonic())
+
+    async def _async_poll_motions(self) -> None:
+        """Poll the X4VR group until no cover moves anymore."""
+        try:
+            while self._motions:
+                await asyncio.sleep(COVER_POLL_INTERVAL)
+                last_poll = self._coordinator.last_poll(GROUP_X4VR)
+                if monotonic() - last_poll >= COVER_POLL_INTERVAL:
+                    await self._coordinator.async_refresh_groups({GROUP_X4VR})
+                now = monotonic()
+                data = self._coordinator.data
+                for slot, motion in list(self._motions.items()):
+                    polled = data.get(slot)
+                    if motion.is_over(polled, now):
+                        _LOGGER.debug("End of the motion of cover %s", slot)
+                        del self._motions[slot]
+                    motion.last_polled = polled
+                    motion.update_callback()
+        finally:
+            self._task = None
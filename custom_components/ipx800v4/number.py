@@ -1,6 +1,7 @@
 """Support for IPX800 V4 numbers."""
 
 import logging
+from typing import Any
 
 from pypx800 import IPX800, Counter, VAInput
 
@@ -21,6 +22,7 @@ from .const import (
     TYPE_VIRTUALANALOGIN,
 )
 from .entity import IpxEntity
+from .snapshot import Slot, native_number
 
 _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = GLOBAL_PARALLEL_UPDATES
@@ -42,7 +44,7 @@ async def async_setup_entry(
         if device.get(CONF_TYPE) in [TYPE_VIRTUALANALOGIN, TYPE_COUNTER]:
             entities.append(VirtualAnalogInNumber(device, controller, coordinator))  # noqa: PERF401
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 class CounterNumber(IpxEntity, NumberEntity):
@@ -62,19 +64,23 @@ class CounterNumber(IpxEntity, NumberEntity):
         super().__init__(device_config, ipx, coordinator)
         self.control = Counter(ipx, self._id)
 
-    @property
-    def available(self) -> bool:
-        """Return True if the counter is present in the last update."""
-        return self._data_available(f"C{self._id}")
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"C{self._id}",)
+
+    def _push_values(self, state: str) -> dict[Slot, Any] | None:
+        """Convert a pushed state to snapshot values."""
+        return self._push_number(state)
 
     @property
     def native_value(self) -> float:
         """Return the current value."""
-        return self.coordinator.data[f"C{self._id}"]
+        return native_number(self._value())
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         await self.control.set_value(value)
+        self._async_commanded({self._slot(): float(value)})
 
 
 class VirtualAnalogInNumber(IpxEntity, NumberEntity):
@@ -90,16 +96,20 @@ class VirtualAnalogInNumber(IpxEntity, NumberEntity):
         super().__init__(device_config, ipx, coordinator)
         self.control = VAInput(ipx, self._id)
 
-    @property
-    def available(self) -> bool:
-        """Return True if the virtual analog input is present in the last update."""
-        return self._data_available(f"VA{self._id}")
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"VA{self._id}",)
+
+    def _push_values(self, state: str) -> dict[Slot, Any] | None:
+        """Convert a pushed state to snapshot values."""
+        return self._push_number(state)
 
     @property
     def native_value(self) -> float:
         """Return the current value."""
-        return self.coordinator.data[f"VA{self._id}"]
+        return native_number(self._value())
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
         await self.control.set_value(value)
+        self._async_commanded({self._slot(): float(value)})
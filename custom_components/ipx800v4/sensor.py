@@ -1,6 +1,7 @@
 """Support for IPX800 V4 sensors."""
 
 import logging
+from typing import Any
 
 from pypx800 import IPX800
 
@@ -10,9 +11,13 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
 
 from .const import (
     CONF_DEVICES,
@@ -27,7 +32,10 @@ from .const import (
     TYPE_XENO,
     TYPE_XTHL,
 )
+from .coordinator import IpxDataUpdateCoordinator
 from .entity import IpxEntity
+from .gateway import IpxGateway
+from .snapshot import Slot, native_number
 
 _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = GLOBAL_PARALLEL_UPDATES
@@ -95,49 +103,61 @@ async def async_setup_entry(
                 )
             )
 
-    async_add_entities(entities, True)
+    if coordinator.min_scan_interval is not None:
+        entities.append(ScanIntervalSensor(controller, coordinator))
+
+    async_add_entities(entities)
 
 
 class AnalogInSensor(IpxEntity, SensorEntity):
     """Representation of a IPX sensor through analog input."""
 
-    @property
-    def available(self) -> bool:
-        """Return True if the analog input is present in the last update."""
-        return self._data_available(f"A{self._id}")
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"A{self._id}",)
+
+    def _push_values(self, state: str) -> dict[Slot, Any] | None:
+        """Convert a pushed state to snapshot values."""
+        return self._push_number(state)
 
     @property
     def native_value(self) -> float:
         """Return the current value."""
-        return self.coordinator.data[f"A{self._id}"]
+        return native_number(self._value())
 
 
 class CounterSensor(IpxEntity, SensorEntity):
     """Representation of a IPX sensor through analog input."""
 
-    @property
-    def available(self) -> bool:
-        """Return True if the counter is present in the last update."""
-        return self._data_available(f"C{self._id}")
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"C{self._id}",)
+
+    def _push_values(self, state: str) -> dict[Slot, Any] | None:
+        """Convert a pushed state to snapshot values."""
+        return self._push_number(state)
 
     @property
     def native_value(self) -> float:
         """Return the current value."""
-        return self.coordinator.data[f"C{self._id}"]
+        return native_number(self._value())
 
 
 class VirtualAnalogInSensor(IpxEntity, SensorEntity):
     """Representation of a IPX sensor through virtual analog input."""
 
-    @property
-    def available(self) -> bool:
-        """Return True if the virtual analog input is present in the last update."""
-        return self._data_available(f"VA{self._id}")
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"VA{self._id}",)
+
+    def _push_values(self, state: str) -> dict[Slot, Any] | None:
+        """Convert a pushed state to snapshot values."""
+        return self._push_number(state)
 
     @property
     def native_value(self) -> float:
         """Return the current value."""
-        return self.coordinator.data[f"VA{self._id}"]
+        return native_number(self._value())
 
 
 class XTHLSensor(IpxEntity, SensorEntity):
@@ -154,34 +174,66 @@ class XTHLSensor(IpxEntity, SensorEntity):
         suffix_name: str,
     ) -> None:
         """Initialize the XTHLSensor."""
+        self._req_type = req_type
         super().__init__(device_config, ipx, coordinator, suffix_name)
         self._attr_device_class = device_class
         self._attr_native_unit_of_measurement = unit_of_measurement
         self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._req_type = req_type
 
-    @property
-    def available(self) -> bool:
-        """Return True if the sensor value is present in the last update."""
-        return self._data_available(f"THL{self._id}-{self._req_type}")
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"THL{self._id}-{self._req_type}",)
+
+    def _push_values(self, state: str) -> dict[Slot, Any] | None:
+        """Convert a pushed state to snapshot values."""
+        return self._push_number(state)
 
     @property
     def native_value(self) -> float:
         """Return the current value."""
-        return round(self.coordinator.data[f"THL{self._id}-{self._req_type}"], 1)
+        return round(self._value(), 1)
 
 
 class XENOSensor(IpxEntity, SensorEntity):
     """Representation of an Enocean sensor."""
 
-    @property
-    def available(self) -> bool:
-        """Return True if the sensor value is present in the last update."""
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
         analog_id = int(self._id) - 121 + 17
-        return self._data_available(f"ENO ANALOG{analog_id}")
+        return (f"ENO ANALOG{analog_id}",)
+
+    def _push_values(self, state: str) -> dict[Slot, Any] | None:
+        """Convert a pushed state to snapshot values."""
+        return self._push_number(state)
 
     @property
     def native_value(self) -> float:
         """Return the current value."""
-        analog_id = int(self._id) - 121 + 17
-        return round(self.coordinator.data[f"ENO ANALOG{analog_id}"], 1)
+        return round(self._value(), 1)
+
+
+class ScanIntervalSensor(CoordinatorEntity[IpxDataUpdateCoordinator], SensorEntity):
+    """Representation of the adapted scan interval of the IPX800."""
+
+    _attr_has_entity_name = True
+    _attr_name = "Scan interval"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, ipx: IpxGateway, coordinator: IpxDataUpdateCoordinator) -> None:
+        """Initialize the sensor on the IPX800 device."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{DOMAIN}_{ipx.host}_scan_interval"
+        self._attr_device_info = {"identifiers": {(DOMAIN, ipx.host)}}
+
+    @property
+    def available(self) -> bool:
+        """Return True, the interval also backs off while polls fail."""
+        return True
+
+    @property
+    def native_value(self) -> float:
+        """Return the scan interval in use."""
+        return round(self.coordinator.scan_interval, 1)
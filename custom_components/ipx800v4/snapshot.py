@@ -0,0 +1,319 @@
+"""Columnar snapshot of the GCE IPX800 V4 values."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Collection, Mapping
+import logging
+from string import digits
+from typing import Any
+
+from .const import (
+    GROUP_ANALOGIN,
+    GROUP_COUNTER,
+    GROUP_DIGITALIN,
+    GROUP_RELAY,
+    GROUP_VIRTUALANALOGIN,
+    GROUP_VIRTUALIN,
+    GROUP_VIRTUALOUT,
+    GROUP_X4FP,
+    GROUP_X4VR,
+    GROUP_XDIMMER,
+    GROUP_XENO,
+    GROUP_XPWM,
+    GROUP_XTHL,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# One column per group, in this order. A column stores the values of a group
+# in an array at the offset of their id, typecode None is a plain list.
+COLUMNS: tuple[tuple[str, str | None, int], ...] = (
+    # (group, typecode, cells per id)
+    (GROUP_RELAY, "B", 1),
+    (GROUP_DIGITALIN, "B", 1),
+    (GROUP_VIRTUALIN, "B", 1),
+    (GROUP_VIRTUALOUT, "B", 1),
+    (GROUP_ANALOGIN, "d", 1),
+    (GROUP_VIRTUALANALOGIN, "d", 1),
+    (GROUP_COUNTER, "d", 1),
+    (GROUP_XPWM, "B", 1),
+    (GROUP_XDIMMER, "H", 2),
+    (GROUP_X4VR, "H", 1),
+    (GROUP_X4FP, None, 1),
+    (GROUP_XTHL, "d", 3),
+    (GROUP_XENO, "d", 1),
+)
+COLUMN_INDEX = {group: index for index, (group, _, _) in enumerate(COLUMNS)}
+
+# Cells of a X-Dimmer and a X-THL
+XDIMMER_STATE = 0
+XDIMMER_LEVEL = 1
+XTHL_TYPES = ("TEMP", "HUM", "LUM")
+
+# Extensions with 4 outputs per extension id
+_PER_EXTENSION = 4
+
+# Key prefixes of the groups whose key is only prefix and id
+_SIMPLE_PREFIXES = {
+    "R": GROUP_RELAY,
+    "D": GROUP_DIGITALIN,
+    "VI": GROUP_VIRTUALIN,
+    "VO": GROUP_VIRTUALOUT,
+    "A": GROUP_ANALOGIN,
+    "VA": GROUP_VIRTUALANALOGIN,
+    "C": GROUP_COUNTER,
+    "PWM": GROUP_XPWM,
+    "G": GROUP_XDIMMER,
+    "ENO ANALOG": GROUP_XENO,
+}
+
+_KEY_CACHE: dict[str, tuple[int, int] | None] = {}
+_KEY_CACHE_SIZE = 4096
+
+Slot = tuple[int, int]
+
+# On/off states pushed by the IPX800 PUSH
+PUSH_ON_STATES = ("1", "on", "true")
+PUSH_OFF_STATES = ("0", "off", "false")
+
+# Valid values of the integer columns, the others fit their typecode
+_VALUE_RANGES = {
+    COLUMN_INDEX[GROUP_RELAY]: (0, 1),
+    COLUMN_INDEX[GROUP_DIGITALIN]: (0, 1),
+    COLUMN_INDEX[GROUP_VIRTUALIN]: (0, 1),
+    COLUMN_INDEX[GROUP_VIRTUALOUT]: (0, 1),
+    COLUMN_INDEX[GROUP_XPWM]: (0, 100),
+    COLUMN_INDEX[GROUP_X4VR]: (0, 100),
+}
+
+
+def _parse_key(key: str) -> Slot | None:
+    """Return the (column, cell) slot of an IPX800 API key."""
+    prefix = key.rstrip(digits)
+    try:
+        if (group := _SIMPLE_PREFIXES.get(prefix)) is not None:
+            index = int(key[len(prefix) :])
+            if index < 1:
+                return None
+            column = COLUMN_INDEX[group]
+            return column, (index - 1) * COLUMNS[column][2]
+        if key.startswith("VR"):
+            ext_id, _, output_id = key[2:].partition("-")
+            group, ext, index = GROUP_X4VR, int(ext_id), int(output_id)
+        elif key.startswith("FP"):
+            ext_id, _, zone_id = key[2:].partition(" Zone ")
+            group, ext, index = GROUP_X4FP, int(ext_id), int(zone_id)
+        elif key.startswith("THL"):
+            sensor_id, _, sensor_type = key[3:].partition("-")
+            if sensor_type not in XTHL_TYPES or int(sensor_id) < 1:
+                return None
+            return COLUMN_INDEX[GROUP_XTHL], (int(sensor_id) - 1) * len(
+                XTHL_TYPES
+            ) + XTHL_TYPES.index(sensor_type)
+        else:
+            return None
+    except ValueError:
+        return None
+    if ext < 1 or not 1 <= index <= _PER_EXTENSION:
+        return None
+    return COLUMN_INDEX[group], (ext - 1) * _PER_EXTENSION + index - 1
+
+
+def slot_for_key(key: str) -> Slot | None:
+    """Return the (column, cell) slot of an IPX800 API key, None if unknown."""
+    try:
+        return _KEY_CACHE[key]
+    except KeyError:
+        slot = _parse_key(key)
+        if len(_KEY_CACHE) < _KEY_CACHE_SIZE:
+            _KEY_CACHE[key] = slot
+        return slot
+
+
+def columns_for_groups(groups: Collection[str]) -> set[int]:
+    """Return the column indexes of groups."""
+    return {COLUMN_INDEX[group] for group in groups}
+
+
+def in_range(slot: Slot, value: Any) -> bool:
+    """Return True if a typed value is valid for its slot."""
+    if (limits := _VALUE_RANGES.get(slot[0])) is None:
+        return True
+    return limits[0] <= value <= limits[1]
+
+
+def pushed_value(slot: Slot, value: str) -> Any:
+    """Return the typed value of a slot pushed as text, None if invalid."""
+    column = slot[0]
+    typecode = COLUMNS[column][1]
+    if column == COLUMN_INDEX[GROUP_XDIMMER]:
+        # State and level are pushed separately, no single value
+        return None
+    if typecode is None:
+        return value
+    try:
+        if typecode == "d":
+            return float(value)
+        if value.lower() in PUSH_ON_STATES:
+            return 1
+        if value.lower() in PUSH_OFF_STATES:
+            return 0
+        typed_value = round(float(value))
+    except (OverflowError, ValueError):
+        return None
+    return typed_value if in_range(slot, typed_value) else None
+
+
+def native_number(value: float) -> float | int:
+    """Return an integral float as int, as the IPX800 API would."""
+    return int(value) if value.is_integer() else value
+
+
+def _new_column(column: int) -> array | list:
+    """Return an empty column."""
+    typecode = COLUMNS[column][1]
+    return [] if typecode is None else array(typecode)
+
+
+def _cells(column: int, value: Any) -> tuple:
+    """Convert a value from the IPX800 API to the cells of its column."""
+    if column == COLUMN_INDEX[GROUP_XDIMMER]:
+        return (int(value["Etat"] == "ON"), int(value["Valeur"]))
+    typecode = COLUMNS[column][1]
+    if typecode is None:
+        return (value,)
+    if typecode == "d":
+        return (float(value),)
+    return (int(value),)
+
+
+class IpxSnapshot:
+    """Typed, array-backed values of an IPX800 with presence masks.
+
+    A snapshot is never modified once published: updates return a new
+    snapshot that shares the unchanged columns with the previous one.
+    """
+
+    __slots__ = ("present", "values")
+
+    def __init__(
+        self,
+        values: list[array | list] | None = None,
+        present: list[bytearray] | None = None,
+    ) -> None:
+        """Initialize the snapshot, empty by default."""
+        self.values = values or [_new_column(col) for col in range(len(COLUMNS))]
+        self.present = present or [bytearray() for _ in COLUMNS]
+
+    def has(self, slot: Slot) -> bool:
+        """Return True if a value is present for the slot."""
+        column, cell = slot
+        mask = self.present[column]
+        return cell < len(mask) and mask[cell] == 1
+
+    def get(self, slot: Slot, default: Any = None) -> Any:
+        """Return the value of the slot or default if not present."""
+        if not self.has(slot):
+            return default
+        return self.values[slot[0]][slot[1]]
+
+    def as_dict(self) -> dict[str, list]:
+        """Return the snapshot as JSON serializable data."""
+        return {
+            "values": [list(values) for values in self.values],
+            "present": [present.hex() for present in self.present],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> IpxSnapshot | None:
+        """Return the snapshot of data from as_dict, None if invalid."""
+        try:
+            stored_values, stored_present = data["values"], data["present"]
+            if not len(stored_values) == len(stored_present) == len(COLUMNS):
+                return None
+            values: list[array | list] = []
+            present: list[bytearray] = []
+            for column, (stored, mask) in enumerate(zip(stored_values, stored_present)):
+                typecode = COLUMNS[column][1]
+                values.append(
+                    list(stored) if typecode is None else array(typecode, stored)
+                )
+                present.append(bytearray.fromhex(mask))
+                if len(values[column]) != len(present[column]):
+                    return None
+        except (KeyError, OverflowError, TypeError, ValueError):
+            return None
+        return cls(values, present)
+
+    def merged(
+        self, values: Mapping[str, Any], replace: Collection[int] = ()
+    ) -> IpxSnapshot:
+        """Return a new snapshot updated with values keyed like the API.
+
+        The columns to replace start empty, so values missing from the
+        response are no longer present, the others keep their values.
+        """
+        new_values = list(self.values)
+        new_present = list(self.present)
+        copied = set(replace)
+        for column in replace:
+            new_values[column] = _new_column(column)
+            new_present[column] = bytearray()
+
+        for key, value in values.items():
+            if (slot := slot_for_key(key)) is None:
+                continue
+            column, cell = slot
+            if column not in copied:
+                new_values[column] = new_values[column][:]
+                new_present[column] = bytearray(new_present[column])
+                copied.add(column)
+            try:
+                self._store(
+                    new_values[column],
+                    new_present[column],
+                    cell,
+                    _cells(column, value),
+                )
+            except (KeyError, OverflowError, TypeError, ValueError):
+                _LOGGER.debug("Ignore invalid value for %s: %s", key, value)
+
+        return IpxSnapshot(new_values, new_present)
+
+    def patched(self, updates: Mapping[Slot, Any]) -> IpxSnapshot:
+        """Return a new snapshot with typed values set on slots."""
+        new_values = list(self.values)
+        new_present = list(self.present)
+        copied: set[int] = set()
+        for slot, value in updates.items():
+            column, cell = slot
+            if column not in copied:
+                new_values[column] = new_values[column][:]
+                new_present[column] = bytearray(new_present[column])
+                copied.add(column)
+            try:
+                self._store(new_values[column], new_present[column], cell, (value,))
+            except (OverflowError, TypeError):
+                _LOGGER.debug("Ignore invalid value for slot %s: %s", slot, value)
+        return IpxSnapshot(new_values, new_present)
+
+    @staticmethod
+    def _store(
+        values: array | list, present: bytearray, cell: int, cells: tuple
+    ) -> None:
+        """Store cells from the given one, growing the column if needed."""
+        if isinstance(values, array):
+            # Build the typed cells first, raise before touching the column
+            cells = array(values.typecode, cells)
+            filler: Any = 0
+        else:
+            cells = list(cells)
+            filler = None
+        end = cell + len(cells)
+        if end > len(values):
+            missing = end - len(values)
+            values.extend([filler] * missing)
+            present.extend(bytes(missing))
+        values[cell:end] = cells
+        present[cell:end] = b"\x01" * len(cells)
@@ -3,7 +3,14 @@
 import logging
 from typing import Any
 
-from pypx800 import IPX800, Ipx800RequestError, Relay, VInput, VOutput
+from pypx800 import (
+    IPX800,
+    Ipx800CannotConnectError,
+    Ipx800RequestError,
+    Relay,
+    VInput,
+    VOutput,
+)
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
@@ -23,6 +30,7 @@ from .const import (
     TYPE_VIRTUALOUT,
 )
 from .entity import IpxEntity
+from .snapshot import Slot
 
 _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = GLOBAL_PARALLEL_UPDATES
@@ -48,7 +56,7 @@ async def async_setup_entry(
         elif device.get(CONF_TYPE) == TYPE_VIRTUALIN:
             entities.append(VirtualInSwitch(device, controller, coordinator))
 
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 class RelaySwitch(IpxEntity, SwitchEntity):
@@ -64,30 +72,33 @@ class RelaySwitch(IpxEntity, SwitchEntity):
         super().__init__(device_config, ipx, coordinator)
         self.control = Relay(ipx, self._id)
 
-    @property
-    def available(self) -> bool:
-        """Return True if the relay state is present in the last update."""
-        return self._data_available(f"R{self._id}")
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"R{self._id}",)
+
+    def _push_values(self, state: str) -> dict[Slot, Any] | None:
+        """Convert a pushed state to snapshot values."""
+        return self._push_on_off(state)
 
     @property
     def is_on(self) -> bool:
         """Return the state."""
-        return self.coordinator.data[f"R{self._id}"] == 1
+        return self._value() == 1
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the switch."""
         try:
             await self.control.on()
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._async_commanded({self._slot(): 1})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error("An error occurred while toggle IPX800 switch: %s", self.name)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
         try:
             await self.control.off()
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._async_commanded({self._slot(): 0})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while turn off IPX800 switch: %s", self.name
             )
@@ -95,9 +106,10 @@ class RelaySwitch(IpxEntity, SwitchEntity):
     async def async_toggle(self, **kwargs: Any) -> None:
         """Toggle the switch."""
         try:
+            is_on = self.is_on
             await self.control.toggle()
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._async_commanded({self._slot(): int(not is_on)})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error("An error occurred while toggle IPX800 switch: %s", self.name)
 
 
@@ -114,22 +126,25 @@ class VirtualOutSwitch(IpxEntity, SwitchEntity):
         super().__init__(device_config, ipx, coordinator)
         self.control = VOutput(ipx, self._id)
 
-    @property
-    def available(self) -> bool:
-        """Return True if the virtual output is present in the last update."""
-        return self._data_available(f"VO{self._id}")
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"VO{self._id}",)
+
+    def _push_values(self, state: str) -> dict[Slot, Any] | None:
+        """Convert a pushed state to snapshot values."""
+        return self._push_on_off(state)
 
     @property
     def is_on(self) -> bool:
         """Return the state."""
-        return self.coordinator.data[f"VO{self._id}"] == 1
+        return self._value() == 1
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the switch."""
         try:
             await self.control.on()
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._async_commanded({self._slot(): 1})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while turn on IPX800 switch: %s", self.name
             )
@@ -138,8 +153,8 @@ class VirtualOutSwitch(IpxEntity, SwitchEntity):
         """Turn off the switch."""
         try:
             await self.control.off()
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._async_commanded({self._slot(): 0})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while turn off IPX800 switch: %s", self.name
             )
@@ -147,9 +162,10 @@ class VirtualOutSwitch(IpxEntity, SwitchEntity):
     async def async_toggle(self, **kwargs: Any) -> None:
         """Toggle the switch."""
         try:
+            is_on = self.is_on
             await self.control.toggle()
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._async_commanded({self._slot(): int(not is_on)})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error("An error occurred while toggle IPX800 switch: %s", self.name)
 
 
@@ -166,22 +182,25 @@ class VirtualInSwitch(IpxEntity, SwitchEntity):
         super().__init__(device_config, ipx, coordinator)
         self.control = VInput(ipx, self._id)
 
-    @property
-    def available(self) -> bool:
-        """Return True if the virtual input is present in the last update."""
-        return self._data_available(f"VI{self._id}")
+    def _get_data_keys(self) -> tuple[str, ...]:
+        """Return the coordinator data keys read by the entity."""
+        return (f"VI{self._id}",)
+
+    def _push_values(self, state: str) -> dict[Slot, Any] | None:
+        """Convert a pushed state to snapshot values."""
+        return self._push_on_off(state)
 
     @property
     def is_on(self) -> bool:
         """Return the state."""
-        return self.coordinator.data[f"VI{self._id}"] == 1
+        return self._value() == 1
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the switch."""
         try:
             await self.control.on()
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._async_commanded({self._slot(): 1})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while turn on IPX800 switch: %s", self.name
             )
@@ -190,8 +209,8 @@ class VirtualInSwitch(IpxEntity, SwitchEntity):
         """Turn off the switch."""
         try:
             await self.control.off()
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._async_commanded({self._slot(): 0})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error(
                 "An error occurred while turn off IPX800 switch: %s", self.name
             )
@@ -199,7 +218,8 @@ class VirtualInSwitch(IpxEntity, SwitchEntity):
     async def async_toggle(self, **kwargs: Any) -> None:
         """Toggle the switch."""
         try:
+            is_on = self.is_on
             await self.control.toggle()
-            await self.coordinator.async_request_refresh()
-        except Ipx800RequestError:
+            self._async_commanded({self._slot(): int(not is_on)})
+        except (Ipx800CannotConnectError, Ipx800RequestError):
             _LOGGER.error("An error occurred while toggle IPX800 switch: %s", self.name)
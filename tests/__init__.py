@@ -0,0 +1 @@
+"""Tests of the GCE IPX800 V4 integration."""
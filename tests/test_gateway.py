@@ -0,0 +1,262 @@
+"""Tests of the request scheduling and command batching of a gateway."""
+
+import asyncio
+import json
+
+import aiohttp
+from pypx800 import Ipx800RequestError
+import pytest
+import pytest_asyncio
+
+from custom_components.ipx800v4.gateway import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    IpxGateway,
+    IpxRequestScheduler,
+)
+
+
+class FakeTransport:
+    """A fake M2M connection recording the requests of a gateway."""
+
+    def __init__(self) -> None:
+        """Initialize the transport."""
+        self.requests: list[dict] = []
+        self.failing: set[str] = set()
+
+    async def request_raw(self, params: dict) -> bytes:
+        """Answer a request, with an error if one of its params is failing."""
+        self.requests.append(params)
+        status = "Error" if self.failing & set(params) else "Success"
+        return json.dumps({"product": "IPX800_V4", "status": status}).encode()
+
+    async def async_close(self) -> None:
+        """Close the connection."""
+
+
+@pytest_asyncio.fixture
+async def transport():
+    """Return the fake transport of the gateway."""
+    return FakeTransport()
+
+
+@pytest_asyncio.fixture
+async def gateway(transport):
+    """Return a gateway sending its JSON API requests to the fake transport."""
+    async with aiohttp.ClientSession() as session:
+        ipx = IpxGateway(
+            host="127.0.0.1",
+            port=80,
+            api_key="apikey",
+            session=session,
+            m2m=transport,
+        )
+        yield ipx
+        await ipx.async_close()
+
+
+async def hold_slot(
+    scheduler: IpxRequestScheduler,
+    priority: int,
+    name: str,
+    order: list[str],
+    release: asyncio.Event,
+) -> None:
+    """Hold a slot of the scheduler until released."""
+    async with scheduler.slot(priority):
+        order.append(name)
+        await release.wait()
+
+
+async def assert_slot_free(scheduler: IpxRequestScheduler) -> None:
+    """Assert a slot of the scheduler is given at once."""
+    async with asyncio.timeout(1), scheduler.slot(PRIORITY_POLL):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_scheduler_priority() -> None:
+    """Test commands are served before polls, each in arrival order."""
+    scheduler = IpxRequestScheduler(1)
+    order: list[str] = []
+    release = asyncio.Event()
+    holder = asyncio.create_task(
+        hold_slot(scheduler, PRIORITY_POLL, "holder", order, release)
+    )
+    await asyncio.sleep(0)
+    waiters = [
+        asyncio.create_task(hold_slot(scheduler, priority, name, order, release))
+        for priority, name in (
+            (PRIORITY_POLL, "poll 1"),
+            (PRIORITY_COMMAND, "command 1"),
+            (PRIORITY_POLL, "poll 2"),
+            (PRIORITY_COMMAND, "command 2"),
+        )
+    ]
+    await asyncio.sleep(0)
+
+    release.set()
+    await asyncio.gather(holder, *waiters)
+
+    assert order == ["holder", "command 1", "command 2", "poll 1", "poll 2"]
+    await assert_slot_free(scheduler)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_cancel_queued() -> None:
+    """Test a cancelled waiter leaves the queue."""
+    scheduler = IpxRequestScheduler(1)
+    order: list[str] = []
+    release = asyncio.Event()
+    holder = asyncio.create_task(
+        hold_slot(scheduler, PRIORITY_POLL, "holder", order, release)
+    )
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(
+        hold_slot(scheduler, PRIORITY_COMMAND, "cancelled", order, release)
+    )
+    waiter = asyncio.create_task(
+        hold_slot(scheduler, PRIORITY_POLL, "waiter", order, release)
+    )
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    release.set()
+    await asyncio.gather(holder, waiter)
+
+    assert order == ["holder", "waiter"]
+    await assert_slot_free(scheduler)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_cancel_after_release() -> None:
+    """Test a waiter cancelled right before the slot is released.
+
+    The release drops the cancelled waiter from the queue before the waiter
+    handles its cancellation.
+    """
+    scheduler = IpxRequestScheduler(1)
+    order: list[str] = []
+    release = asyncio.Event()
+    holder = asyncio.create_task(
+        hold_slot(scheduler, PRIORITY_POLL, "holder", order, release)
+    )
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(
+        hold_slot(scheduler, PRIORITY_POLL, "cancelled", order, release)
+    )
+    await asyncio.sleep(0)
+
+    # The holder runs first and releases the slot
+    release.set()
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    await holder
+
+    assert order == ["holder"]
+    await assert_slot_free(scheduler)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_cancel_woken() -> None:
+    """Test a waiter cancelled once woken hands the slot to the next one."""
+    scheduler = IpxRequestScheduler(1)
+    order: list[str] = []
+    release = asyncio.Event()
+    holder = asyncio.create_task(
+        hold_slot(scheduler, PRIORITY_POLL, "holder", order, release)
+    )
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(
+        hold_slot(scheduler, PRIORITY_COMMAND, "cancelled", order, release)
+    )
+    waiter = asyncio.create_task(
+        hold_slot(scheduler, PRIORITY_POLL, "waiter", order, release)
+    )
+    await asyncio.sleep(0)
+
+    # The holder hands the slot over, then the woken waiter is cancelled
+    release.set()
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    await asyncio.gather(holder, waiter)
+
+    assert order == ["holder", "waiter"]
+    await assert_slot_free(scheduler)
+
+
+@pytest.mark.asyncio
+async def test_batch_same_action(gateway, transport) -> None:
+    """Test ids of the same action are sent in one request."""
+    results = await asyncio.gather(
+        gateway.request_api({"SetR": 1}),
+        gateway.request_api({"SetR": 2}),
+        gateway.request_api({"SetR": 3}),
+    )
+
+    assert transport.requests == [{"SetR": "1,2,3"}]
+    assert [result["status"] for result in results] == ["Success"] * 3
+
+
+@pytest.mark.asyncio
+async def test_batch_order(gateway, transport) -> None:
+    """Test a new action or a repeated id starts a new request, in order."""
+    await asyncio.gather(
+        gateway.request_api({"SetR": 1}),
+        gateway.request_api({"SetR": 2}),
+        gateway.request_api({"ClearR": 3}),
+        gateway.request_api({"SetR": 4}),
+        gateway.request_api({"ToggleVO": 5}),
+        gateway.request_api({"ToggleVO": 5}),
+    )
+
+    assert transport.requests == [
+        {"SetR": "1,2"},
+        {"ClearR": "3"},
+        {"SetR": "4"},
+        {"ToggleVO": "5"},
+        {"ToggleVO": "5"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_other_commands(gateway, transport) -> None:
+    """Test other commands are each sent alone."""
+    await asyncio.gather(
+        gateway.request_api({"SetC01": "+5"}),
+        gateway.request_api({"SetC01": "+5"}),
+        gateway.request_api({"SetG03": 50, "Time": 500}),
+        gateway.request_api({"SetR": 1}),
+    )
+
+    assert transport.requests == [
+        {"SetC01": "+5"},
+        {"SetC01": "+5"},
+        {"SetG03": 50, "Time": 500},
+        {"SetR": "1"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_failure(gateway, transport) -> None:
+    """Test each caller gets the result of the request of its command."""
+    transport.failing = {"ClearR"}
+
+    results = await asyncio.gather(
+        gateway.request_api({"SetR": 1}),
+        gateway.request_api({"ClearR": 2}),
+        gateway.request_api({"ClearR": 3}),
+        gateway.request_api({"SetR": 4}),
+        return_exceptions=True,
+    )
+
+    assert transport.requests == [{"SetR": "1"}, {"ClearR": "2,3"}, {"SetR": "4"}]
+    assert results[0]["status"] == "Success"
+    assert isinstance(results[1], Ipx800RequestError)
+    assert isinstance(results[2], Ipx800RequestError)
+    assert results[3]["status"] == "Success"
@@ -0,0 +1,137 @@
+"""Tests of the M2M connection against a local fake IPX800."""
+
+import asyncio
+from urllib.parse import parse_qsl
+
+from pypx800 import Ipx800CannotConnectError
+import pytest
+import pytest_asyncio
+
+from custom_components.ipx800v4 import m2m
+from custom_components.ipx800v4.m2m import IpxM2MConnection
+
+API_KEY = "apikey"
+
+
+class FakeM2MServer:
+    """A fake M2M interface answering each request line with one JSON line."""
+
+    def __init__(self) -> None:
+        """Initialize the server."""
+        self.server: asyncio.Server | None = None
+        self.port = 0
+        self.requests: list[dict[str, str]] = []
+        self.connections = 0
+        self.drop_next = False
+        self.relays = "0" * 56
+
+    async def start(self) -> None:
+        """Listen on a free local port."""
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer the requests of a connection until it is closed."""
+        self.connections += 1
+        try:
+            while line := await reader.readline():
+                params = dict(parse_qsl(line.decode().strip()))
+                self.requests.append(params)
+                if self.drop_next:
+                    # Close the connection without answering
+                    self.drop_next = False
+                    break
+                writer.write(self._answer(params).encode() + b"\r\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    def _answer(self, params: dict[str, str]) -> str:
+        """Return the JSON answer of a request."""
+        if params.get("key") != API_KEY:
+            return '{"product": "IPX800_V4", "status": "Error"}'
+        if "SetR" in params:
+            index = int(params["SetR"]) - 1
+            self.relays = self.relays[:index] + "1" + self.relays[index + 1 :]
+            return '{"product": "IPX800_V4", "status": "Success"}'
+        if params.get("Get") == "R":
+            relays = ", ".join(
+                f'"R{index}": {state}'
+                for index, state in enumerate(self.relays[:8], start=1)
+            )
+            return f'{{"product": "IPX800_V4", "status": "Success", {relays}}}'
+        return '{"product": "IPX800_V4", "status": "Error"}'
+
+
+@pytest_asyncio.fixture
+async def server():
+    """Run a fake M2M interface."""
+    fake = FakeM2MServer()
+    await fake.start()
+    yield fake
+    await fake.stop()
+
+
+@pytest_asyncio.fixture
+async def connection(server):
+    """Return a connection to the fake M2M interface."""
+    conn = IpxM2MConnection("127.0.0.1", server.port, API_KEY)
+    yield conn
+    await conn.async_close()
+
+
+@pytest.mark.asyncio
+async def test_command(server, connection) -> None:
+    """Test a command is sent with the API key and answered."""
+    response = await connection.request_raw({"SetR": "03"})
+
+    assert b'"status": "Success"' in response
+    assert server.requests == [{"key": API_KEY, "SetR": "03"}]
+    assert server.relays[:8] == "00100000"
+
+
+@pytest.mark.asyncio
+async def test_state_read(server, connection) -> None:
+    """Test states are read over the same connection as the commands."""
+    await connection.request_raw({"SetR": "02"})
+    response = await connection.request_raw({"Get": "R"})
+
+    assert b'"R1": 0' in response
+    assert b'"R2": 1' in response
+    assert server.connections == 1
+
+
+@pytest.mark.asyncio
+async def test_dropped_connection(server, connection) -> None:
+    """Test a dropped connection fails and waits before reconnecting."""
+    await connection.request_raw({"Get": "R"})
+    server.drop_next = True
+
+    with pytest.raises(Ipx800CannotConnectError):
+        await connection.request_raw({"Get": "R"})
+    with pytest.raises(Ipx800CannotConnectError, match="Waiting"):
+        await connection.request_raw({"Get": "R"})
+    assert server.connections == 1
+    assert len(server.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_reconnect(server, connection, monkeypatch) -> None:
+    """Test a new connection is opened once the backoff is over."""
+    monkeypatch.setattr(m2m, "M2M_BACKOFF_MIN", 0)
+    await connection.request_raw({"Get": "R"})
+    server.drop_next = True
+
+    with pytest.raises(Ipx800CannotConnectError):
+        await connection.request_raw({"Get": "R"})
+    response = await connection.request_raw({"Get": "R"})
+
+    assert b'"status": "Success"' in response
+    assert server.connections == 2
@@ -0,0 +1,23 @@
+"""Tests of the motion tracking of the covers."""
+
+from custom_components.ipx800v4.const import COVER_MOTION_GRACE
+from custom_components.ipx800v4.motion import CoverMotion
+
+
+def test_motion_over_stopped() -> None:
+    """Test a motion is over once the position no longer changes."""
+    motion = CoverMotion(0, 100, 0.0, 10.0, lambda: None, 40)
+    now = 10.0 + COVER_MOTION_GRACE
+
+    # Checking the end of a motion does not change its result
+    assert not motion.is_over(50, now)
+    assert not motion.is_over(50, now)
+    assert motion.is_over(40, now)
+
+
+def test_motion_over_target() -> None:
+    """Test a motion is over once the target is reached."""
+    motion = CoverMotion(0, 100, 0.0, 10.0, lambda: None, 0)
+
+    assert not motion.is_over(50, 1.0)
+    assert motion.is_over(100, 1.0)
@@ -0,0 +1,25 @@
+"""Tests of the snapshot of the IPX800 values."""
+
+import pytest
+
+from custom_components.ipx800v4.snapshot import pushed_value, slot_for_key
+
+
+@pytest.mark.parametrize(
+    ("key", "value", "expected"),
+    [
+        ("R1", "on", 1),
+        ("R1", "0", 0),
+        ("R1", "2", None),
+        ("PWM1", "55.4", 55),
+        ("PWM1", "101", None),
+        ("VR1-1", "100", 100),
+        ("VR1-1", "-5", None),
+        ("VR1-1", "inf", None),
+        ("A1", "-5", -5.0),
+        ("A1", "level", None),
+    ],
+)
+def test_pushed_value(key: str, value: str, expected) -> None:
+    """Test pushed values are typed and checked against their column."""
+    assert pushed_value(slot_for_key(key), value) == expected